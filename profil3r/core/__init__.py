@@ -1,23 +1,36 @@
 import json
 
+from profil3r.engine import (
+    Engine,
+    MirrorState,
+    Resolver,
+    ResponseArchive,
+    ResultCache,
+    Session,
+    SharedScheduler,
+)
 from profil3r.modules.email import email
 
 
 class Core(object):
 
     from ._argparse import parse_arguments
+    from ._batch import run_batch
+    from ._journal import close_journal, journal_path, resume_journal, start_journal
     from ._logo import print_logo
     from ._menu import menu
     from ._modules import get_report_modules, modules_update
     from ._permutations import get_permutations
+    from ._reextract import reextract
     from ._report import (
         generate_csv_report,
         generate_HTML_report,
         generate_json_report,
         generate_report,
     )
-    from ._results import print_results
-    from ._run import run
+    from ._results import add_results, print_results
+    from ._run import get_services, run, stream
+    from ._workers import search, start_workers, stop_workers
     from .services._domain import domain
     from .services._email import email
     from .services._entertainment import dailymotion, vimeo
@@ -47,13 +60,107 @@ class Core(object):
 
     def __init__(self, config_path):
         self.version = "1.3.11"
+        self.config_path = config_path
 
         with open(config_path, "r") as f:
             self.CONFIG = json.load(f)
 
         self.separators = []
+        # File of targets of a batch run (--targets-file), None to search a single one
+        self.targets_file = None
+        # Journal of the completed probes of the run, --resume <run id> resumes the
+        # interrupted run with this id
+        self.run_id = None
+        self.journal = None
+        self.resume = None
         self.result = {}
         self.permutations_list = []
+
+        settings = self.CONFIG.get("profil3r", {})
+        # Maximum duration of a run in seconds, None for no limit
+        self.deadline = settings.get("deadline")
+        # Only check that the accounts exist, without scraping their informations
+        self.existence_only = settings.get("existence_only", False)
+        # Number of worker processes probing the candidates, each one owns a shard of
+        # the hosts, 1 to probe them in this process
+        self.workers = settings.get("workers", 1)
+        self.worker_pool = None
+
+        # Outcomes of the probes cached between the runs
+        self.cache = None
+        if settings.get("cache", True):
+            self.cache = ResultCache(
+                settings.get("cache_path", "~/.cache/profil3r/results.sqlite"),
+                ttl=settings.get("cache_ttl", 86400),
+                negative_ttl=settings.get("cache_negative_ttl", 3600),
+                max_entries=settings.get("cache_max_entries", 100000),
+            )
+
+        # Pages of the confirmed accounts archived for offline re-extraction
+        self.archive_path = settings.get(
+            "archive_path", "~/.cache/profil3r/archive.sqlite"
+        )
+        self.archive = None
+        if settings.get("archive", False):
+            self.archive = ResponseArchive(
+                self.archive_path,
+                max_bytes=settings.get("archive_max_bytes", 100 * 1024 * 1024),
+            )
+        # Re-run the extractors over the archived pages instead of probing
+        self.from_archive = False
+
+        # Rate limits shared with the other Profil3r processes of the machine
+        self.scheduler = None
+        if settings.get("shared_rate_limits", True):
+            self.scheduler = SharedScheduler(
+                settings.get("rate_limits_path", "~/.cache/profil3r/rate_limits.sqlite")
+            )
+
+        self.engine = Engine(
+            max_per_host=settings.get("max_per_host", 1),
+            max_workers=settings.get("max_workers", 10),
+            retry_count=settings.get("retry_count", 0),
+            retry_backoff=settings.get("retry_backoff", 0.5),
+            enrich_concurrency=settings.get("enrich_concurrency", 4),
+            parse_workers=settings.get("parse_workers", 2),
+            parse_backend=settings.get("parse_backend", "thread"),
+            scheduler=self.scheduler,
+            cache=self.cache,
+            archive=self.archive,
+            hedge_ratio=settings.get("hedge_ratio", 0),
+            breaker_threshold=settings.get("breaker_threshold", 5),
+            breaker_cooldown=settings.get("breaker_cooldown", 30),
+            max_per_host_limit=settings.get("max_per_host_limit", 4),
+            throttle_retries=settings.get("throttle_retries", 3),
+        )
+        # DNS resolver shared by every service, domains are resolved in bulk
+        self.resolver = Resolver(
+            workers=settings.get("dns_workers", 32),
+            ttl=settings.get("dns_ttl", 300),
+        )
+        # Health of the mirror front-ends (nitter, bibliogram...) kept between the runs
+        self.mirror_state = MirrorState(
+            settings.get("mirrors_path", "~/.cache/profil3r/mirrors.json"),
+            ttl=settings.get("mirrors_ttl", 3600),
+        )
+        self.mirror_timeout = settings.get("mirror_timeout", 3)
+        # Connection pool shared by every service
+        self.session = Session(
+            pool_connections=settings.get("pool_connections", 30),
+            pool_maxsize=settings.get(
+                "pool_maxsize",
+                max(
+                    settings.get("max_per_host", 1),
+                    settings.get("max_per_host_limit", 4),
+                ),
+            ),
+            user_agent=settings.get("user_agent"),
+            timeout=(
+                settings.get("connect_timeout", 5),
+                settings.get("timeout", 10),
+            ),
+        )
+
         self.modules = {
             # Emails
             "email": {"method": self.email},
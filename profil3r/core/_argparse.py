@@ -28,13 +28,60 @@ def parse_arguments(self, profiles_list=None):
     # The original code had two ArgumentParser initializations. Consolidating.
     # parser = argparse.ArgumentParser() # This was redundant
 
-    parser.add_argument(
+    # A single target, or a file of targets searched in the same run
+    # Keep required for CLI usage
+    targets = parser.add_mutually_exclusive_group(required=True)
+    targets.add_argument(
         "-p",
         "--profile",
-        required=True,  # Keep required for CLI usage
         nargs="+",
         help="parts of the username that you are looking for, e.g. : john doe",
     )
+    targets.add_argument(
+        "--targets-file",
+        help='CSV (john,doe per row) or NDJSON ({"profile": ["john", "doe"]} per line) file of targets searched in a single run, with a report per target and a combined index',
+    )
+    targets.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="resume an interrupted run from its journal, the completed probes are not sent again",
+    )
+
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        help="maximum duration of the run in seconds, the report is generated with the results found so far",
+    )
+
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="existence-only mode, the accounts are checked with HEAD or partial requests and their informations are not scraped",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="do not use the cached outcomes of the previous runs, nor cache the new ones",
+    )
+
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="probe every candidate again and update the cached outcomes",
+    )
+
+    parser.add_argument(
+        "--reextract",
+        action="store_true",
+        help="re-run the extractors over the archived pages of the accounts, without any request",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="number of worker processes probing the candidates, each one owns a shard of the hosts",
+    )
 
     # Check if we are in a context where parsing is appropriate
     # (e.g. not when imported and profiles_list is passed)
@@ -44,6 +91,20 @@ def parse_arguments(self, profiles_list=None):
             args = parser.parse_args()
             # Items passed from the command line
             self.items = args.profile
+            self.targets_file = args.targets_file
+            self.resume = args.resume
+            if args.deadline is not None:
+                self.deadline = args.deadline
+            if args.fast:
+                self.existence_only = True
+            if args.no_cache:
+                self.engine.cache = None
+            if args.refresh:
+                self.engine.refresh = True
+            if args.reextract:
+                self.from_archive = True
+            if args.workers is not None:
+                self.workers = args.workers
         except SystemExit as e:
             # This happens when --help is used or a required argument is missing.
             # For CLI, this is fine. For library use, this should not happen if profiles_list is passed.
@@ -0,0 +1,121 @@
+import csv
+import datetime
+import json
+import os
+
+from profil3r.core.colors import Colors
+
+
+# Targets of a batch run, read lazily from a CSV or NDJSON file
+# CSV : one target per row, each cell is a part of the username, e.g. john,doe
+# NDJSON : one object per line, {"profile": ["john", "doe"]} or {"profile": "john doe"}
+# with an optional "id"
+# Yields (id, parts) pairs, the id defaults to the parts joined by "_"
+def read_targets(path):
+    ndjson = path.endswith((".ndjson", ".jsonl"))
+
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        lines = (line for line in f if line.strip() and not line.startswith("#"))
+
+        if ndjson:
+            for line in lines:
+                target = json.loads(line)
+                parts = target["profile"]
+                if isinstance(parts, str):
+                    parts = parts.split()
+                yield target.get("id", "_".join(parts)), parts
+        else:
+            for row in csv.reader(lines):
+                parts = [cell.strip() for cell in row if cell.strip()]
+                if parts:
+                    yield "_".join(parts), parts
+
+
+# Search every target of the file in a single run
+# The targets share the engine (scheduler, circuit breakers, result cache) or the
+# worker processes, the connection pool, the DNS cache and the health of the
+# mirrors. Each target gets its own reports, a line per target is appended to the
+# index of the batch as soon as it is done, only the results of the current target
+# are kept in memory
+def run_batch(self, targets_file, interactive=True, deadline=None):
+    modules_to_run = self.get_report_modules()
+
+    # A resumed batch appends to the index of its run
+    run_id = self.run_id
+    if run_id is None:
+        run_id = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    index_path = self.CONFIG.get(
+        "batch_index_path", "./reports/batch/{}.ndjson"
+    ).format(run_id)
+    if os.path.dirname(index_path):
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+
+    with open(index_path, "a", encoding="utf-8") as index:
+        for target, parts in read_targets(targets_file):
+            # Target done before the run was interrupted
+            if self.journal is not None and target in self.journal.completed:
+                continue
+            if self.journal is not None:
+                self.journal.target = target
+
+            if interactive:
+                print(
+                    "\n"
+                    + Colors.BOLD
+                    + "[+] "
+                    + Colors.ENDC
+                    + "Target {} : {}".format(target, " ".join(parts))
+                )
+
+            self.items = parts
+            self.permutations_list = []
+            self.get_permutations()
+            if not self.permutations_list:
+                continue
+
+            self.result = {}
+            services = self.get_services(modules_to_run, interactive=interactive)
+            if self.from_archive:
+                self.reextract(services)
+            else:
+                self.search(services, deadline=deadline, target=target)
+
+            if not os.path.exists("reports"):
+                os.makedirs("reports")
+            reports = {
+                "json": self.generate_json_report(),
+                "html": self.generate_HTML_report(),
+                "csv": self.generate_csv_report(),
+            }
+
+            index.write(
+                json.dumps(
+                    {
+                        "target": target,
+                        "profile": parts,
+                        "accounts": sum(
+                            len(result["accounts"]) for result in self.result.values()
+                        ),
+                        "status": {
+                            name: result.get("status", "complete")
+                            for name, result in self.result.items()
+                        },
+                        "reports": reports,
+                    }
+                )
+                + "\n"
+            )
+            # A crash keeps the index of the targets already done
+            index.flush()
+            if self.journal is not None:
+                self.journal.done(target)
+            self.result = {}
+
+    print(
+        "\n"
+        + Colors.BOLD
+        + "[+] "
+        + Colors.ENDC
+        + "Batch index was generated in {}".format(index_path)
+    )
+    return index_path
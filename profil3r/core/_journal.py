@@ -0,0 +1,82 @@
+import datetime
+import os
+
+from profil3r.core.colors import Colors
+from profil3r.engine import Journal
+
+
+def journal_path(self, run_id):
+    return (
+        self.CONFIG.get("profil3r", {})
+        .get("journal_path", "~/.cache/profil3r/journals/{}.ndjson")
+        .format(run_id)
+    )
+
+
+# Start the journal of a new run, the completed probes are appended to it
+# Only the interactive runs keep a journal by default, the others (e.g. the web UI)
+# when the "journal" setting is set
+def start_journal(self, interactive=True, deadline=None):
+    if self.journal is not None:
+        return
+    if not self.CONFIG.get("profil3r", {}).get("journal", interactive):
+        return
+
+    self.run_id = "{}_{}".format(
+        datetime.datetime.now().strftime("%Y%m%d_%H%M%S"), os.getpid()
+    )
+    self.journal = Journal(self.journal_path(self.run_id))
+    # Everything needed to run the same search again
+    self.journal.write(
+        {
+            "run": self.run_id,
+            "profile": self.items,
+            "targets_file": self.targets_file,
+            "separators": self.separators,
+            "modules": self.CONFIG["report_elements"],
+            "existence_only": self.existence_only,
+            "workers": self.workers,
+            "deadline": deadline if deadline is not None else self.deadline,
+        }
+    )
+    self.engine.journal = self.journal
+
+    if interactive:
+        print(
+            Colors.BOLD
+            + "[+] "
+            + Colors.ENDC
+            + "Run {}, resume it with --resume {}".format(self.run_id, self.run_id)
+        )
+
+
+# Resume an interrupted run from its journal : the profile, the separators, the
+# modules and the options (--fast, --workers, --deadline) of the run are restored,
+# the completed probes are not sent again
+def resume_journal(self, run_id):
+    self.journal = Journal(self.journal_path(run_id))
+    run = self.journal.load()
+    if run is None:
+        raise ValueError("The journal of the run {} is empty.".format(run_id))
+
+    self.run_id = run_id
+    self.items = run["profile"]
+    self.targets_file = run["targets_file"]
+    self.separators = run["separators"]
+    self.CONFIG["report_elements"] = run["modules"]
+    # Journals written before the options were recorded keep the current ones
+    self.existence_only = run.get("existence_only", self.existence_only)
+    self.workers = run.get("workers", self.workers)
+    self.deadline = run.get("deadline", self.deadline)
+    self.engine.journal = self.journal
+
+
+# remove is set once the reports of the run are written, its journal is no longer
+# needed
+def close_journal(self, remove=False):
+    if self.journal is not None:
+        self.journal.close()
+        if remove:
+            os.remove(self.journal.path)
+    self.journal = None
+    self.engine.journal = None
@@ -1,29 +1,141 @@
-from itertools import chain, combinations, permutations
+from collections import Counter
+from fractions import Fraction
+from itertools import combinations, product
+from itertools import permutations as itertools_permutations
+from math import comb, factorial, perm
 
 
-# return all possible permutation for a username
+# Distinct arrangements of k names taken from the multiset counts {name: count}
+def arrangements(counts, k):
+    if k == 0:
+        yield ()
+        return
+
+    for name in counts:
+        if counts[name]:
+            counts[name] -= 1
+            for rest in arrangements(counts, k - 1):
+                yield (name,) + rest
+            counts[name] += 1
+
+
+# Every way to fill the gaps between the names, a gap is either empty or a
+# separator, a separator is used once at most
+def interleavings(names, separators):
+    if len(names) == 1:
+        yield names[0]
+        return
+
+    for i, separator in enumerate([""] + separators):
+        rest = separators if i == 0 else separators[: i - 1] + separators[i:]
+        for end in interleavings(names[1:], rest):
+            yield names[0] + separator + end
+
+
+# return all possible permutation for a username, lazily
 # exemple : ["john", "doe"] -> ("john", "doe", "johndoe", "doejohn", "john.doe", "doe.john")
-def get_permutations(self):
-    [self.items.append(separator) for separator in self.separators]
+# Only the valid usernames are built, a separator is never at the start or the end
+# and never next to another separator
+# A repeated name is not arranged twice, but a username built in two ways (e.g.
+# "ab" from ["ab", "a", "b"]) is yielded twice, Service.canonical_permutations()
+# drops the duplicates without keeping every username in memory here
+def permutations(items, separators):
+    counts = Counter(items)
+    separators = list(dict.fromkeys(separators))
 
-    combinations_list = list(
-        chain(
-            *map(lambda x: combinations(self.items, x), range(1, len(self.items) + 1))
+    for k in range(1, len(items) + 1):
+        for names in arrangements(counts, k):
+            yield from interleavings(names, separators)
+
+
+# Number of usernames yielded by permutations(), without enumerating them
+# It is the number of distinct usernames only if none can be built in two ways
+def count_permutations(items, separators):
+    separators = len(set(separators))
+
+    # The distinct arrangements of k names of the multiset are
+    # k! * [x^k] prod(sum(x^i / i! for i <= count) for each name)
+    polynomial = [Fraction(1)]
+    for count in Counter(items).values():
+        product = [Fraction(0)] * (len(polynomial) + count)
+        for i, a in enumerate(polynomial):
+            for j in range(count + 1):
+                product[i + j] += a / factorial(j)
+        polynomial = product
+
+    total = 0
+    for k in range(1, len(items) + 1):
+        names = factorial(k) * polynomial[k]
+
+        # Ways to fill the k - 1 gaps with j distinct separators
+        gaps = sum(
+            comb(k - 1, j) * perm(separators, j)
+            for j in range(min(k - 1, separators) + 1)
         )
-    )
-    for combination in combinations_list:
-        for perm in list(permutations(combination)):
-
-            # True if there are two consecutive separators in the permutation, for exemple : ["john", ".", "-", "doe"]
-            consecutives_separators = False in [
-                (perm[i] not in self.separators) or (perm[i + 1] not in self.separators)
-                for i in range(len(perm) - 1)
-            ]
-
-            # Remove combinations that start or end by a dot or have consecutives separators
-            if (
-                perm[0] not in self.separators
-                and perm[-1] not in self.separators
-                and not consecutives_separators
-            ):
-                self.permutations_list.append("".join(perm))
+        total += int(names) * gaps
+
+    return total
+
+
+# Every way to put the separators (distinct, in any order) in j of the gaps between
+# the names
+def placements(names, separators, j):
+    for gaps in combinations(range(len(names) - 1), j):
+        for order in itertools_permutations(separators):
+            placed = dict(zip(gaps, order))
+            yield "".join(name + placed.get(i, "") for i, name in enumerate(names))
+
+
+# Same usernames as permutations(), lazily and from the most to the least likely :
+# plain concatenations first, then the ones with the fewest separators between the
+# names, shorter before longer, the most common separators (the first selected ones)
+# and the order of the names given by the user break the ties
+# Only the separators put between the names count, not the ones inside a name such
+# as "jean-luc"
+def ranked_permutations(items, separators):
+    counts = Counter(items)
+    separators = list(dict.fromkeys(separators))
+    names = list(counts)
+
+    # Every non empty sub-multiset of the names, as the count of each name
+    selections = [
+        selection
+        for selection in product(*[range(counts[name], -1, -1) for name in names])
+        if any(selection)
+    ]
+
+    for j in range(min(len(items) - 1, len(separators)) + 1):
+        # Groups of usernames made of the same names and separators, they all have
+        # the same length
+        groups = []
+        for selection in selections:
+            if sum(selection) <= j:
+                continue
+            length = sum(len(name) * count for name, count in zip(names, selection))
+            for used in combinations(range(len(separators)), j):
+                length_used = length + sum(len(separators[i]) for i in used)
+                groups.append((length_used, sum(used), selection, used))
+        groups.sort(key=lambda group: group[:2])
+
+        for _, _, selection, used in groups:
+            selected = Counter(dict(zip(names, selection)))
+            for arrangement in arrangements(selected, sum(selection)):
+                yield from placements(arrangement, [separators[i] for i in used], j)
+
+
+# Ranked permutations of a profile, generated again each time they are iterated so
+# that only the candidates actually probed are built and none is kept in memory
+class RankedPermutations:
+    def __init__(self, items, separators):
+        self.items = list(items)
+        self.separators = list(separators)
+
+    def __iter__(self):
+        return ranked_permutations(self.items, self.separators)
+
+    def __bool__(self):
+        return next(iter(self), None) is not None
+
+
+def get_permutations(self):
+    self.permutations_list = RankedPermutations(self.items, self.separators)
@@ -0,0 +1,24 @@
+from profil3r.engine import ResponseArchive
+
+
+# Re-run the current extractors of the services over the archived pages of their
+# candidates, without any request
+# Only the services scraping the pages of the accounts are reported
+def reextract(self, services):
+    archive = self.archive
+    if archive is None:
+        archive = ResponseArchive(self.archive_path)
+
+    for name, service in services.items():
+        if not service.scrapes():
+            continue
+
+        accounts = []
+        for username in service.possible_usernames():
+            r = archive.get(name, username)
+            if r is not None:
+                accounts.append(service.scrape(username, r))
+
+        self.add_results(
+            name, {"type": service.type, "accounts": accounts, "status": "complete"}
+        )
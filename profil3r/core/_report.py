@@ -34,6 +34,7 @@ def generate_json_report(self):
         + Colors.ENDC
         + "JSON report was generated in {}".format(file_name)
     )
+    return file_name
 
 
 # Generate a report in HTML format containing the collected data
@@ -107,11 +108,14 @@ def generate_csv_report(self):
         with open(file_name, "w", newline="") as fp:
             writer = csv.writer(fp)
             # columns titles
-            writer.writerow(["service", "category", "profile", "breached"])
+            writer.writerow(["service", "category", "profile", "breached", "status"])
 
             for service, result in self.result.items():
                 result_service = service
                 result_type = result["type"]
+                # complete, truncated when the search was cut short or unavailable
+                # when the site is down
+                result_status = result.get("status", "complete")
                 for account in result["accounts"]:
                     result_value = account["value"]
                     result_breached = (
@@ -119,7 +123,13 @@ def generate_csv_report(self):
                     )
                     # row values
                     writer.writerow(
-                        [result_service, result_type, result_value, result_breached]
+                        [
+                            result_service,
+                            result_type,
+                            result_value,
+                            result_breached,
+                            result_status,
+                        ]
                     )
 
     except Exception as e:
@@ -131,6 +141,7 @@ def generate_csv_report(self):
         + Colors.ENDC
         + "CSV report was generated in {}".format(file_name)
     )
+    return file_name
 
 
 def generate_report(self, html_output_filepath=None):
@@ -1,10 +1,23 @@
 from profil3r.core.colors import Colors
 
 
+# Called by the engine as soon as a service is done
+def add_results(self, element, element_results):
+    self.result[element] = element_results
+    self.print_results(element)
+
+
 def print_results(self, element):
     if element in self.result:
         element_results = self.result[element]
 
+        # Services that could not be searched entirely (deadline, time budget...)
+        status = ""
+        if element_results.get("status", "complete") != "complete":
+            status = (
+                Colors.WARNING + " ({})".format(element_results["status"]) + Colors.ENDC
+            )
+
         # Section title
 
         # No results
@@ -20,6 +33,7 @@ def print_results(self, element):
                 + Colors.FAIL
                 + " (No results)"
                 + Colors.ENDC
+                + status
             )
             return
         # Results
@@ -32,6 +46,7 @@ def print_results(self, element):
                 + Colors.OKGREEN
                 + " {} ✔️".format(element.upper())
                 + Colors.ENDC
+                + status
             )
 
         # General case
@@ -1,15 +1,44 @@
-import threading
-
+from profil3r.core._permutations import count_permutations
 from profil3r.core.colors import Colors
 
 
-def run(self, profiles_list=None, html_report_filepath=None, interactive=True):
+def run(
+    self,
+    profiles_list=None,
+    html_report_filepath=None,
+    interactive=True,
+    deadline=None,
+):
     if interactive:
         self.print_logo()
 
     # If profiles_list is provided, use it. Otherwise, parse_arguments will try to get them from CLI.
     self.parse_arguments(profiles_list=profiles_list)
 
+    # The options of a resumed run come from its journal, the menu is skipped
+    resuming = self.resume is not None
+    if resuming:
+        self.resume_journal(self.resume)
+
+    # Batch mode, every target of the file is searched with the same options
+    if self.targets_file is not None:
+        if interactive and not resuming:
+            self.menu()
+        self.start_journal(interactive=interactive, deadline=deadline)
+        try:
+            result = self.run_batch(
+                self.targets_file, interactive=interactive, deadline=deadline
+            )
+        except BaseException:
+            self.close_journal()
+            raise
+        finally:
+            self.stop_workers()
+            self.engine.close()
+        # Every target is reported, the journal of the run is no longer needed
+        self.close_journal(remove=True)
+        return result
+
     # Ensure self.items is populated
     if not hasattr(self, "items") or not self.items:
         if interactive:
@@ -24,7 +53,7 @@ def run(self, profiles_list=None, html_report_filepath=None, interactive=True):
         # Raising an error might be better for the web UI to catch and display.
         raise ValueError("No profiles provided to Profil3r.")
 
-    if interactive:
+    if interactive and not resuming:
         self.menu()  # Show menu only in interactive mode
     else:
         # For non-interactive mode, we need to ensure `self.CONFIG["selected_modules"]` is set.
@@ -48,13 +77,14 @@ def run(self, profiles_list=None, html_report_filepath=None, interactive=True):
         )
 
     if interactive:
-        # Number of permutations to test per service
+        # Number of permutations to test per service, an upper bound since the
+        # duplicates and the usernames a site rejects are skipped
         print(
             Colors.BOLD
             + "[+]"
             + Colors.ENDC
-            + " {} permutations to test for each service, you can reduce this number by selecting less options if it takes too long".format(
-                len(self.permutations_list)
+            + " Up to {} permutations to test for each service, you can reduce this number by selecting less options if it takes too long".format(
+                count_permutations(self.items, self.separators)
             )
         )
 
@@ -75,12 +105,78 @@ def run(self, profiles_list=None, html_report_filepath=None, interactive=True):
     # Clear previous results before running modules
     self.result = {}
 
-    threads = []
+    # Completed probes are journaled, an interrupted run can be resumed
+    self.start_journal(interactive=interactive, deadline=deadline)
+
+    services = self.get_services(modules_to_run, interactive=interactive)
+
+    # The journal of a run that fails is kept, the run can be resumed
+    try:
+        if self.from_archive:
+            # No request, the accounts are extracted from the archived pages
+            self.reextract(services)
+        else:
+            # Every (service, candidate) pair is probed under a single event loop, or
+            # by the worker processes with --workers
+            # When the deadline expires, the report is generated with the partial
+            # results
+            try:
+                self.search(services, deadline=deadline)
+            finally:
+                self.stop_workers()
+                self.engine.close()
+
+        # Pass the desired HTML report filepath to generate_report
+        generated_report_path = self.generate_report(
+            html_output_filepath=html_report_filepath
+        )
+    except BaseException:
+        self.close_journal()
+        raise
+    # The report is written, the journal of the run is no longer needed
+    self.close_journal(remove=True)
+
+    if interactive:
+        # The generate_report method (and its sub-methods like generate_HTML_report)
+        # already prints confirmation messages for CLI.
+        pass
+
+    return generated_report_path  # Return the path to the generated HTML report
+
+
+# Instantiate the services of the modules to run
+def get_services(self, modules_to_run, interactive=False):
+    services = {}
     for module_name in modules_to_run:
         if module_name in self.modules:
-            thread = threading.Thread(target=self.modules[module_name]["method"])
-            threads.append(thread)
-            thread.start()
+            services[module_name] = self.modules[module_name]["method"]()
+            # Every service shares the connection pool of the Core
+            services[module_name].session = self.session
+            services[module_name].mirror_state = self.mirror_state
+            services[module_name].mirror_timeout = self.mirror_timeout
+            service_config = self.CONFIG["plateform"][module_name]
+            # Optional time budget of the service, in seconds
+            services[module_name].budget = service_config.get("budget")
+            # Cheap existence check supported by the site (HEAD or streamed GET)
+            services[module_name].probe = service_config.get("probe")
+            services[module_name].existence_only = self.existence_only
+            # Lifetime of the cached outcomes of the service, in seconds
+            services[module_name].cache_ttl = service_config.get("cache_ttl")
+            services[module_name].cache_negative_ttl = service_config.get(
+                "cache_negative_ttl"
+            )
+            # Optional limits of the number of candidates and of accounts found
+            services[module_name].max_candidates = service_config.get("max_candidates")
+            services[module_name].max_hits = service_config.get("max_hits")
+            # Username rules of the site, the modules keep their own by default
+            if "case_sensitive" in service_config:
+                services[module_name].case_sensitive = (
+                    service_config["case_sensitive"] == "yes"
+                )
+            if "allowed_characters" in service_config:
+                services[module_name].allowed_characters = service_config[
+                    "allowed_characters"
+                ]
         else:
             if interactive:
                 print(
@@ -89,18 +185,30 @@ def run(self, profiles_list=None, html_report_filepath=None, interactive=True):
                     + f"[!] Module '{module_name}' not found in configured modules."
                     + Colors.ENDC
                 )
+    return services
 
-    for thread in threads:
-        thread.join()
 
-    # Pass the desired HTML report filepath to generate_report
-    generated_report_path = self.generate_report(
-        html_output_filepath=html_report_filepath
-    )
+# Streaming variant of run(), for the web UI and other non-interactive consumers
+# Yields (service, account) pairs as soon as the accounts are confirmed, self.result
+# is complete once the stream is exhausted and can then be passed to generate_report
+def stream(self, profiles_list, deadline=None):
+    self.parse_arguments(profiles_list=profiles_list)
 
-    if interactive:
-        # The generate_report method (and its sub-methods like generate_HTML_report)
-        # already prints confirmation messages for CLI.
-        pass
+    self.permutations_list = []
+    self.get_permutations()
+    if not self.permutations_list:
+        raise ValueError(
+            "No permutations generated. Check profile inputs and separators."
+        )
 
-    return generated_report_path  # Return the path to the generated HTML report
+    self.result = {}
+    services = self.get_services(self.get_report_modules())
+
+    try:
+        yield from self.engine.stream(
+            services,
+            callback=self.result.__setitem__,
+            deadline=deadline if deadline is not None else self.deadline,
+        )
+    finally:
+        self.engine.close()
@@ -0,0 +1,127 @@
+import datetime
+import os
+from functools import partial
+from itertools import islice
+from urllib.error import URLError
+from urllib.parse import urlparse
+
+import requests
+
+from profil3r.engine import WorkerPool
+from profil3r.engine.workqueue import DONE, UNAVAILABLE
+
+
+# (engine, services) of a worker process, built from the same config as the
+# coordinator, the candidates come from the work queue
+def build_worker(config_path, modules, options):
+    from profil3r.core import Core
+
+    core = Core(config_path)
+    core.existence_only = options["existence_only"]
+    if options["no_cache"]:
+        core.engine.cache = None
+    core.engine.refresh = options["refresh"]
+
+    services = core.get_services(modules)
+    for service in services.values():
+        # The probes of a service that can't be set up fail
+        try:
+            service.setup()
+        except (requests.RequestException, URLError):
+            pass
+    return core.engine, services
+
+
+def start_workers(self, modules):
+    settings = self.CONFIG.get("profil3r", {})
+    run_id = self.run_id
+    if run_id is None:
+        run_id = "{}_{}".format(
+            datetime.datetime.now().strftime("%Y%m%d_%H%M%S"), os.getpid()
+        )
+    path = settings.get("work_queue_path", "~/.cache/profil3r/queues/{}.sqlite")
+
+    options = {
+        "existence_only": self.existence_only,
+        "no_cache": self.engine.cache is None,
+        "refresh": self.engine.refresh,
+    }
+    self.worker_pool = WorkerPool(
+        path.format(run_id),
+        self.workers,
+        partial(build_worker, self.config_path, modules, options),
+        batch=settings.get("work_batch", 100),
+    )
+    self.worker_pool.start()
+
+
+def stop_workers(self):
+    if self.worker_pool is not None:
+        self.worker_pool.stop()
+    self.worker_pool = None
+
+
+# Search the services for the current target, with the engine or, with --workers,
+# with the worker processes
+# The results of every service are passed to add_results
+def search(self, services, deadline=None, target=""):
+    deadline = deadline if deadline is not None else self.deadline
+
+    if self.workers <= 1:
+        self.engine.run(services, callback=self.add_results, deadline=deadline)
+        return
+
+    if self.worker_pool is None:
+        self.start_workers(list(services))
+
+    results = {}
+    candidates = {}
+    outcomes = {}
+    items = []
+    for name, service in services.items():
+        results[name] = {"type": service.type, "accounts": [], "status": "complete"}
+        try:
+            service.setup()
+        except (requests.RequestException, URLError):
+            print("failed to connect to {}".format(name))
+            results[name]["status"] = "unavailable"
+            continue
+
+        # The candidates are ranked, only the most likely ones are generated
+        candidates[name] = list(islice(service.candidates(), service.max_candidates))
+
+        for candidate in candidates[name]:
+            # Probe completed by the interrupted run being resumed
+            if self.journal is not None:
+                found, account = self.journal.get(name, candidate)
+                if found:
+                    outcomes[name, candidate] = account
+                    continue
+            # Every candidate of a host goes to the worker owning the host
+            host = urlparse(service.probe_url(candidate)).netloc
+            items.append((name, candidate, host))
+
+    for name, candidate, state, account in self.worker_pool.run(
+        target, items, deadline
+    ):
+        if state == UNAVAILABLE:
+            results[name]["status"] = "unavailable"
+            continue
+        # Cancelled at the deadline or failed, the candidate has no verdict and is
+        # probed again by a resumed run
+        if state != DONE:
+            if results[name]["status"] != "unavailable":
+                results[name]["status"] = "truncated"
+            continue
+        outcomes[name, candidate] = account
+        if self.journal is not None:
+            self.journal.record(name, candidate, account)
+
+    # Keep the order of the candidates
+    for name in services:
+        if results[name]["status"] == "unavailable" and name in candidates:
+            print("{} is unavailable".format(name))
+        for candidate in candidates.get(name, []):
+            if outcomes.get((name, candidate)) is not None:
+                results[name]["accounts"].append(outcomes[name, candidate])
+        self.add_results(name, results[name])
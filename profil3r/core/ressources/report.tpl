@@ -18,6 +18,12 @@
 
             <section class="container">
 
+                    {% for service, accounts in results %}
+                        {% if accounts.get("status", "complete") != "complete" %}
+                        <span class="badge badge-warning">{{ service }} : {{ accounts["status"] }}</span>
+                        {% endif %}
+                    {% endfor %}
+
                     <input type="search" class="light-table-filter searchbar" data-table="order-table" placeholder="Filter results">
 
                     <table class="order-table table">
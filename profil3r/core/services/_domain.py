@@ -3,6 +3,7 @@ from profil3r.modules.domain.domain import Domain
 
 # Domain
 def domain(self):
-    self.result["domain"] = Domain(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("domain")
+    domain = Domain(self.CONFIG, self.permutations_list)
+    # The domains are resolved in bulk by the resolver of the Core
+    domain.resolver = self.resolver
+    return domain
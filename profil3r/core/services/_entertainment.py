@@ -4,15 +4,9 @@ from profil3r.modules.entertainment.vimeo import Vimeo
 
 # Dailymotion
 def dailymotion(self):
-    self.result["dailymotion"] = Dailymotion(
-        self.CONFIG, self.permutations_list
-    ).search()
-    # print results
-    self.print_results("dailymotion")
+    return Dailymotion(self.CONFIG, self.permutations_list)
 
 
 # Vimeo
 def vimeo(self):
-    self.result["vimeo"] = Vimeo(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("vimeo")
+    return Vimeo(self.CONFIG, self.permutations_list)
@@ -7,38 +7,24 @@ from profil3r.modules.forum.zeroxzerozerosec import ZeroxZeroZeroSec
 
 # 0x00sec
 def zeroxzerozerosec(self):
-    self.result["0x00sec"] = ZeroxZeroZeroSec(
-        self.CONFIG, self.permutations_list
-    ).search()
-    # print results
-    self.print_results("0x00sec")
+    return ZeroxZeroZeroSec(self.CONFIG, self.permutations_list)
 
 
 # jeuxvideo.com
 def jeuxvideo(self):
-    self.result["jeuxvideo.com"] = JeuxVideo(
-        self.CONFIG, self.permutations_list
-    ).search()
-    # print results
-    self.print_results("jeuxvideo.com")
+    return JeuxVideo(self.CONFIG, self.permutations_list)
 
 
 # Hackernews
 def hackernews(self):
-    self.result["hackernews"] = Hackernews(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("hackernews")
+    return Hackernews(self.CONFIG, self.permutations_list)
 
 
 # Cracked.to
 def crackedto(self):
-    self.result["crackedto"] = CrackedTo(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("crackedto")
+    return CrackedTo(self.CONFIG, self.permutations_list)
 
 
 # LessWrong
 def lesswrong(self):
-    self.result["lesswrong"] = LessWrong(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("lesswrong")
+    return LessWrong(self.CONFIG, self.permutations_list)
@@ -4,15 +4,9 @@ from profil3r.modules.money.patreon import Patreon
 
 # BuyMeACoffee
 def buymeacoffee(self):
-    self.result["buymeacoffee"] = BuyMeACoffee(
-        self.CONFIG, self.permutations_list
-    ).search()
-    # print results
-    self.print_results("buymeacoffee")
+    return BuyMeACoffee(self.CONFIG, self.permutations_list)
 
 
 # Patreon
 def patreon(self):
-    self.result["patreon"] = Patreon(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("patreon")
+    return Patreon(self.CONFIG, self.permutations_list)
@@ -5,20 +5,14 @@ from profil3r.modules.music.spotify import Spotify
 
 # Soundcloud
 def soundcloud(self):
-    self.result["soundcloud"] = Soundcloud(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("soundcloud")
+    return Soundcloud(self.CONFIG, self.permutations_list)
 
 
 # Soundcloud
 def spotify(self):
-    self.result["spotify"] = Spotify(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("spotify")
+    return Spotify(self.CONFIG, self.permutations_list)
 
 
 # Smule
 def smule(self):
-    self.result["smule"] = Smule(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("smule")
+    return Smule(self.CONFIG, self.permutations_list)
@@ -5,20 +5,14 @@ from profil3r.modules.porn.xvideos import XVideos
 
 # Pornhub
 def pornhub(self):
-    self.result["pornhub"] = Pornhub(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("pornhub")
+    return Pornhub(self.CONFIG, self.permutations_list)
 
 
 # Redtube
 def redtube(self):
-    self.result["redtube"] = Redtube(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("redtube")
+    return Redtube(self.CONFIG, self.permutations_list)
 
 
 # XVideos
 def xvideos(self):
-    self.result["xvideos"] = XVideos(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("xvideos")
+    return XVideos(self.CONFIG, self.permutations_list)
@@ -5,20 +5,14 @@ from profil3r.modules.programming.replit import Replit
 
 # Github
 def github(self):
-    self.result["github"] = Github(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("github")
+    return Github(self.CONFIG, self.permutations_list)
 
 
 # Pastebin
 def pastebin(self):
-    self.result["pastebin"] = Pastebin(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("pastebin")
+    return Pastebin(self.CONFIG, self.permutations_list)
 
 
 # Repl.it
 def replit(self):
-    self.result["replit"] = Replit(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("replit")
+    return Replit(self.CONFIG, self.permutations_list)
@@ -10,55 +10,39 @@ from profil3r.modules.social.twitter import Twitter
 
 # Facebook
 def facebook(self):
-    self.result["facebook"] = Facebook(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("facebook")
+    return Facebook(self.CONFIG, self.permutations_list)
 
 
 # Twitter
 def twitter(self):
-    self.result["twitter"] = Twitter(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("twitter")
+    return Twitter(self.CONFIG, self.permutations_list)
 
 
 # TikTok
 def tiktok(self):
-    self.result["tiktok"] = TikTok(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("tiktok")
+    return TikTok(self.CONFIG, self.permutations_list)
 
 
 # Instagram
 def instagram(self):
-    self.result["instagram"] = Instagram(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("instagram")
+    return Instagram(self.CONFIG, self.permutations_list)
 
 
 # Pinterest
 def pinterest(self):
-    self.result["pinterest"] = Pinterest(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("pinterest")
+    return Pinterest(self.CONFIG, self.permutations_list)
 
 
 # LinkTree
 def linktree(self):
-    self.result["linktree"] = LinkTree(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("linktree")
+    return LinkTree(self.CONFIG, self.permutations_list)
 
 
 # MySpace
 def myspace(self):
-    self.result["myspace"] = MySpace(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("myspace")
+    return MySpace(self.CONFIG, self.permutations_list)
 
 
 # Flickr
 def flickr(self):
-    self.result["flickr"] = Flickr(self.CONFIG, self.permutations_list).search()
-    # print results
-    self.print_results("flickr")
+    return Flickr(self.CONFIG, self.permutations_list)
@@ -0,0 +1,12 @@
+from .archive import ResponseArchive
+from .breaker import CircuitBreaker, HostUnavailable
+from .cache import ResultCache
+from .engine import Engine
+from .journal import Journal
+from .limiter import AdaptiveLimit, Throttled
+from .mirrors import MirrorPool, MirrorState
+from .resolver import Resolver
+from .scheduler import Scheduler, SharedScheduler, TokenBucket
+from .session import Session
+from .workers import WorkerPool
+from .workqueue import WorkQueue
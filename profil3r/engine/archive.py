@@ -0,0 +1,149 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+import requests
+
+
+# Compressed pages of the confirmed accounts, kept to re-run the extractors offline
+# The bodies are stored once per content (SHA-256), the oldest pages are evicted
+# when the compressed bodies exceed max_bytes
+class ResponseArchive:
+
+    def __init__(self, path, max_bytes=100 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.writes = 0
+
+        path = os.path.expanduser(path)
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        with self.lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS bodies ("
+                "digest TEXT PRIMARY KEY, body BLOB, size INTEGER)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "service TEXT, candidate TEXT, digest TEXT, url TEXT, "
+                "status INTEGER, encoding TEXT, stored REAL, "
+                "PRIMARY KEY (service, candidate))"
+            )
+
+    def put(self, service, candidate, r):
+        body = r.content or b""
+        digest = hashlib.sha256(body).hexdigest()
+
+        with self.lock:
+            previous = self.connection.execute(
+                "SELECT digest FROM responses WHERE service = ? AND candidate = ?",
+                (service, candidate),
+            ).fetchone()
+
+            # The same page (e.g. a generic profile page) is stored once
+            if (
+                self.connection.execute(
+                    "SELECT 1 FROM bodies WHERE digest = ?", (digest,)
+                ).fetchone()
+                is None
+            ):
+                compressed = zlib.compress(body, 6)
+                self.connection.execute(
+                    "INSERT INTO bodies VALUES (?, ?, ?)",
+                    (digest, compressed, len(compressed)),
+                )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    service,
+                    candidate,
+                    digest,
+                    r.url,
+                    r.status_code,
+                    r.encoding,
+                    time.time(),
+                ),
+            )
+            # The page of the candidate changed, its previous body may be unused
+            if previous is not None and previous[0] != digest:
+                self.remove_unused(previous[0])
+            self.writes += 1
+
+        if self.writes % 100 == 0:
+            self.evict()
+
+    # Archived response of the candidate, None if there is none
+    def get(self, service, candidate):
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT bodies.body, url, status, encoding FROM responses "
+                "JOIN bodies ON bodies.digest = responses.digest "
+                "WHERE service = ? AND candidate = ?",
+                (service, candidate),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        body, url, status, encoding = row
+        r = requests.Response()
+        r._content = zlib.decompress(body)
+        r.url = url
+        r.status_code = status
+        r.encoding = encoding
+        return r
+
+    # Remove the body unless another page uses it, returns its size (0 if it is kept)
+    # Called with the lock held
+    def remove_unused(self, digest):
+        if (
+            self.connection.execute(
+                "SELECT 1 FROM responses WHERE digest = ?", (digest,)
+            ).fetchone()
+            is not None
+        ):
+            return 0
+        row = self.connection.execute(
+            "SELECT size FROM bodies WHERE digest = ?", (digest,)
+        ).fetchone()
+        self.connection.execute("DELETE FROM bodies WHERE digest = ?", (digest,))
+        return row[0] if row is not None else 0
+
+    # Remove the oldest pages until the compressed bodies fit in max_bytes
+    def evict(self):
+        with self.lock:
+            # Bodies left by archives written before the unused ones were removed
+            self.connection.execute(
+                "DELETE FROM bodies WHERE digest NOT IN (SELECT digest FROM responses)"
+            )
+            (total,) = self.connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM bodies"
+            ).fetchone()
+            if total <= self.max_bytes:
+                return
+
+            oldest = self.connection.execute(
+                "SELECT service, candidate, digest FROM responses ORDER BY stored"
+            ).fetchall()
+            for service, candidate, digest in oldest:
+                self.connection.execute(
+                    "DELETE FROM responses WHERE service = ? AND candidate = ?",
+                    (service, candidate),
+                )
+                # The body may still be used by another page
+                total -= self.remove_unused(digest)
+                if total <= self.max_bytes:
+                    break
+
+    def close(self):
+        self.evict()
+        with self.lock:
+            self.connection.close()
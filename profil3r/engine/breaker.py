@@ -0,0 +1,56 @@
+import time
+
+
+# Raised instead of sending a request to a host whose circuit breaker is open
+class HostUnavailable(Exception):
+    pass
+
+
+# Circuit breaker of a single host
+# After threshold consecutive failures (connection errors, timeouts or 5xx
+# responses) the breaker opens and the requests to the host are refused. After
+# cooldown seconds a single trial request is let through (half-open), the breaker
+# closes if it succeeds and opens again otherwise
+class CircuitBreaker:
+
+    def __init__(self, threshold=5, cooldown=30):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened = None
+        self.trial = False
+
+    # closed, open or half-open
+    def state(self):
+        if self.opened is None:
+            return "closed"
+        if self.trial or time.monotonic() - self.opened >= self.cooldown:
+            return "half-open"
+        return "open"
+
+    # Whether a request can be sent to the host
+    def allow(self):
+        state = self.state()
+        if state == "closed":
+            return True
+        # Only one trial request at a time
+        if state == "half-open" and not self.trial:
+            self.trial = True
+            return True
+        return False
+
+    def success(self):
+        self.failures = 0
+        self.opened = None
+        self.trial = False
+
+    def failure(self):
+        self.failures += 1
+        if self.trial or self.failures >= self.threshold:
+            self.opened = time.monotonic()
+        self.trial = False
+
+    # The outcome of the trial request is unknown (e.g. it was cancelled), the next
+    # request is let through instead
+    def abort(self):
+        self.trial = False
@@ -0,0 +1,94 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+# Outcome of the probes kept on disk between the runs, keyed by (service, candidate)
+# A confirmed account is kept ttl seconds, a missing one negative_ttl seconds, the
+# oldest entries are evicted beyond max_entries
+class ResultCache:
+
+    def __init__(self, path, ttl=86400, negative_ttl=3600, max_entries=100000):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.writes = 0
+
+        path = os.path.expanduser(path)
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # The engine may run in another thread than the one which opened the cache,
+        # the connection is shared under a lock
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        with self.lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "service TEXT, candidate TEXT, account TEXT, scraped INTEGER, "
+                "stored REAL, PRIMARY KEY (service, candidate))"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_stored ON results (stored)"
+            )
+
+    # Returns (True, account) if the outcome is known, account is None if the
+    # candidate does not exist, (False, None) otherwise
+    # An account whose informations were not scraped is not returned to a scraping run
+    def get(self, service, candidate, scraped, ttl=None, negative_ttl=None):
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT account, scraped, stored FROM results "
+                "WHERE service = ? AND candidate = ?",
+                (service, candidate),
+            ).fetchone()
+
+        if row is None:
+            return False, None
+
+        account, account_scraped, stored = row
+        account = json.loads(account)
+        if account is None:
+            ttl = negative_ttl if negative_ttl is not None else self.negative_ttl
+        else:
+            ttl = ttl if ttl is not None else self.ttl
+            if scraped and not account_scraped:
+                return False, None
+
+        if time.time() - stored > ttl:
+            return False, None
+        return True, account
+
+    def put(self, service, candidate, account, scraped):
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (service, candidate, json.dumps(account), int(scraped), time.time()),
+            )
+            self.writes += 1
+
+        if self.writes % 1000 == 0:
+            self.evict()
+
+    # Remove the oldest entries beyond max_entries
+    def evict(self):
+        with self.lock:
+            (count,) = self.connection.execute(
+                "SELECT COUNT(*) FROM results"
+            ).fetchone()
+            if count > self.max_entries:
+                self.connection.execute(
+                    "DELETE FROM results WHERE rowid IN "
+                    "(SELECT rowid FROM results ORDER BY stored LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def close(self):
+        self.evict()
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,670 @@
+import asyncio
+import queue
+import random
+import threading
+import time
+from concurrent.futures import (
+    BrokenExecutor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from itertools import islice
+from urllib.error import URLError
+from urllib.parse import urlparse
+
+import requests
+
+from .breaker import CircuitBreaker, HostUnavailable
+from .limiter import THROTTLE_STATUSES, AdaptiveLimit, Throttled, retry_after
+from .scheduler import Scheduler
+from .workqueue import DONE, FAILED, UNAVAILABLE
+
+# Errors worth retrying, requests to a host that is up may still fail transiently
+RETRY_ERRORS = (requests.ConnectionError, requests.Timeout, URLError)
+
+
+# fetch(argument) and its duration in seconds, run in a worker thread, the time spent
+# waiting for a free thread is not counted
+def timed_call(fetch, argument):
+    started = time.monotonic()
+    r = fetch(argument)
+    return r, time.monotonic() - started
+
+
+# Run the probes of every service under a single event loop
+# The candidates of each service are probed by a bounded number of tasks, the blocking
+# requests are run in worker threads and the number of concurrent requests to the
+# same host is limited
+# A candidate goes through two stages : a cheap existence probe, then for the
+# confirmed accounts only, the download and scraping of their page
+class Engine:
+
+    def __init__(
+        self,
+        max_per_host=1,
+        max_workers=10,
+        retry_count=0,
+        retry_backoff=0.5,
+        enrich_concurrency=4,
+        parse_workers=2,
+        parse_backend="thread",
+        scheduler=None,
+        cache=None,
+        archive=None,
+        journal=None,
+        hedge_ratio=0,
+        breaker_threshold=5,
+        breaker_cooldown=30,
+        max_per_host_limit=4,
+        throttle_retries=3,
+    ):
+        # Number of concurrent requests to the same host, it grows up to
+        # max_per_host_limit while the host answers fast and is halved when the host
+        # throttles the requests (429 or 503, whose Retry-After is obeyed)
+        self.max_per_host = max_per_host
+        self.max_per_host_limit = max(max_per_host, max_per_host_limit)
+        # A throttled request is retried throttle_retries times, it is then an error
+        # and never a missing account
+        self.throttle_retries = throttle_retries
+        # Number of worker threads running the blocking requests, for all the hosts
+        self.max_workers = max_workers
+        # A failed request is retried retry_count times, waiting a random time up to
+        # retry_backoff * 2^attempt seconds before each retry (exponential backoff)
+        self.retry_count = retry_count
+        self.retry_backoff = retry_backoff
+        # The pages of the confirmed accounts are downloaded and scraped by a separate
+        # stage, limited to enrich_concurrency accounts and parse_workers threads
+        self.enrich_concurrency = enrich_concurrency
+        self.parse_workers = parse_workers
+        # Where the pages are scraped : "inline" (in the event loop), "thread" (worker
+        # threads) or "process" (worker processes, parsing is CPU-bound and holds the
+        # GIL, worker threads would starve the threads doing the requests)
+        self.parse_backend = parse_backend
+        # Per-host token buckets enforcing the rate_limit of the services
+        self.scheduler = scheduler if scheduler is not None else Scheduler()
+        # Outcomes of the previous runs (a ResultCache), None to probe every candidate
+        # With refresh, the candidates are probed again and their outcome updated
+        self.cache = cache
+        self.refresh = False
+        # A probe to a mirror front-end that did not answer within the 90th percentile
+        # of the mirror is also sent to the next healthy mirror, the first answer
+        # wins. Hedged requests are at most hedge_ratio of all the requests, 0 to
+        # disable hedging
+        self.hedge_ratio = hedge_ratio
+        # Pages of the confirmed accounts are kept in a ResponseArchive, None to
+        # discard them
+        self.archive = archive
+        # Completed probes are appended to a Journal, the probes it already holds are
+        # not sent again, None to keep no journal
+        self.journal = journal
+        # The requests to a host are stopped after breaker_threshold consecutive
+        # connection errors or 5xx responses, then a single one is tried again every
+        # breaker_cooldown seconds, 0 to never stop. The breakers are kept between
+        # the runs of the engine
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self.breakers = {}
+        # Pool of the parse backend, started by the first run and kept between the
+        # runs (e.g. the targets of a batch) until close()
+        self.parsers = None
+
+    # services is a dict {name: service}, returns a dict {name: result}
+    # callback(name, result) is called as soon as a service is done
+    # deadline is the maximum duration of the run in seconds, the probes still
+    # running when it expires are cancelled and their services marked as truncated
+    def run(self, services, callback=None, deadline=None):
+        return asyncio.run(self._run(services, callback, deadline=deadline))
+
+    # Iterate over (name, account) pairs, each account is yielded as soon as it is
+    # confirmed, the probes run in a background thread meanwhile
+    def stream(self, services, callback=None, deadline=None):
+        events = queue.Queue()
+        loop = asyncio.new_event_loop()
+        task = loop.create_task(
+            self._run(services, callback, lambda *event: events.put(event), deadline)
+        )
+
+        def produce():
+            try:
+                loop.run_until_complete(task)
+            except BaseException:
+                pass
+            finally:
+                loop.close()
+                events.put(None)
+
+        thread = threading.Thread(target=produce, daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                event = events.get()
+                if event is None:
+                    break
+                yield event
+        finally:
+            # The consumer stopped early
+            if not task.done():
+                loop.call_soon_threadsafe(task.cancel)
+            thread.join()
+
+        # Errors of the run are raised to the consumer
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()
+
+    # Asynchronous variant of stream(), to be used from a running event loop
+    async def astream(self, services, callback=None, deadline=None):
+        events = asyncio.Queue()
+        task = asyncio.ensure_future(
+            self._run(
+                services, callback, lambda *event: events.put_nowait(event), deadline
+            )
+        )
+        task.add_done_callback(lambda _: events.put_nowait(None))
+
+        try:
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                yield event
+            await task
+        finally:
+            task.cancel()
+
+    # on_account(name, account) is called as soon as an account is confirmed
+    async def _run(self, services, callback=None, on_account=None, deadline=None):
+        self._open(callback, on_account, deadline)
+        results = {}
+
+        try:
+            await asyncio.gather(
+                *[
+                    self._search(name, service, results)
+                    for name, service in services.items()
+                ]
+            )
+        finally:
+            self._close()
+
+        return results
+
+    # Probe the given candidates, items is a list of (name, candidate) pairs of the
+    # services, returns the (state, account) of each item : (DONE, account found or
+    # None), (FAILED, None) if the probe failed or (UNAVAILABLE, None) if the circuit
+    # breaker of the host is open
+    # Used by the workers of a sharded run, the candidates come from a work queue
+    def probe_items(self, services, items):
+        return asyncio.run(self._probe_items(services, items))
+
+    async def _probe_items(self, services, items):
+        self._open()
+
+        try:
+            outcomes = await asyncio.gather(
+                *[
+                    self._probe(name, services[name], candidate)
+                    for name, candidate in items
+                ],
+                return_exceptions=True,
+            )
+        finally:
+            self._close()
+
+        # A failed probe is not a miss, the candidate has no verdict
+        states = []
+        for outcome in outcomes:
+            if isinstance(outcome, HostUnavailable):
+                states.append((UNAVAILABLE, None))
+            elif isinstance(outcome, Exception):
+                states.append((FAILED, None))
+            else:
+                states.append((DONE, outcome))
+        return states
+
+    # State of the run, asyncio primitives are bound to the running loop
+    def _open(self, callback=None, on_account=None, deadline=None):
+        loop = asyncio.get_running_loop()
+
+        self.limits = {}
+        self.fetches = {}
+        self.requests = 0
+        self.hedges = 0
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self.enrich_semaphore = asyncio.Semaphore(self.enrich_concurrency)
+        if self.parsers is None:
+            self.parsers = self._parsers()
+        self.callback = callback
+        self.on_account = on_account
+        self.deadline = loop.time() + deadline if deadline is not None else None
+
+    def _close(self):
+        # Requests not started yet are dropped
+        for fetch in list(self.fetches.values()):
+            fetch.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.cache is not None:
+            self.cache.evict()
+
+    # Stop the parser workers, a later run starts new ones
+    def close(self):
+        if self.parsers is not None:
+            self.parsers.shutdown(wait=False, cancel_futures=True)
+            self.parsers = None
+
+    # Pool of the parse backend, None to scrape inline
+    def _parsers(self):
+        if self.parse_backend == "process":
+            return ProcessPoolExecutor(max_workers=self.parse_workers)
+        if self.parse_backend == "thread":
+            return ThreadPoolExecutor(max_workers=self.parse_workers)
+        if self.parse_backend == "inline":
+            return None
+        raise ValueError("unknown parse backend {}".format(self.parse_backend))
+
+    # Number of candidates of a service probed at the same time : enough to keep the
+    # worker threads (or the requests allowed to a host) busy while the confirmed
+    # accounts are enriched
+    def _concurrency(self):
+        return max(self.max_workers, self.max_per_host_limit) + self.enrich_concurrency
+
+    # Number of seconds left to the service, None if it has no time limit
+    def _time_left(self, service, started):
+        loop = asyncio.get_running_loop()
+        limits = []
+
+        if self.deadline is not None:
+            limits.append(self.deadline - loop.time())
+        if service.budget is not None:
+            limits.append(started + service.budget - loop.time())
+
+        return max(0, min(limits)) if limits else None
+
+    async def _search(self, name, service, results):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results[name] = {"type": service.type, "accounts": [], "status": "complete"}
+
+        try:
+            await asyncio.wait_for(
+                loop.run_in_executor(self.executor, service.setup),
+                self._time_left(service, started),
+            )
+        except asyncio.TimeoutError:
+            results[name]["status"] = "truncated"
+        except (requests.RequestException, URLError):
+            print("failed to connect to {}".format(name))
+            results[name]["status"] = "unavailable"
+        else:
+            # The candidates are ranked, only the most likely ones are generated
+            candidates = enumerate(islice(service.candidates(), service.max_candidates))
+
+            # {index of the candidate: account}
+            found = {}
+            enough = asyncio.Event()
+            # The circuit breaker of the site is open, its other candidates are skipped
+            down = asyncio.Event()
+            # Candidates whose probe failed, the search is then incomplete
+            failed = []
+            stopping = False
+
+            # The candidates are pulled from the iterator by a bounded number of
+            # probes, the memory and the cancellation of the search do not depend on
+            # the number of candidates
+            async def worker():
+                for index, username in candidates:
+                    try:
+                        account = await self._probe(name, service, username)
+                    except HostUnavailable:
+                        down.set()
+                        return
+                    except (requests.RequestException, URLError):
+                        failed.append(username)
+                        continue
+                    if account is not None:
+                        found[index] = account
+                        if (
+                            service.max_hits is not None
+                            and len(found) >= service.max_hits
+                        ):
+                            enough.set()
+                    if stopping or enough.is_set() or down.is_set():
+                        return
+
+            workers = [
+                asyncio.ensure_future(worker()) for _ in range(self._concurrency())
+            ]
+            probes = asyncio.ensure_future(asyncio.wait(workers))
+            stop = asyncio.ensure_future(enough.wait())
+            unavailable = asyncio.ensure_future(down.wait())
+            await asyncio.wait(
+                {probes, stop, unavailable},
+                timeout=self._time_left(service, started),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            probes.cancel()
+            stop.cancel()
+            unavailable.cancel()
+
+            # Out of time, enough accounts found or site down, the probes running are
+            # cancelled
+            pending = [task for task in workers if not task.done()]
+            stopping = True
+            for task in pending:
+                task.cancel()
+            # The confirmed accounts not scraped yet are returned by their probe
+            if pending:
+                await asyncio.wait(pending)
+            for task in workers:
+                if not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+
+            if down.is_set():
+                print("{} is unavailable".format(name))
+                results[name]["status"] = "unavailable"
+            elif (pending or failed) and not enough.is_set():
+                results[name]["status"] = "truncated"
+
+            # Keep the order of the candidates
+            results[name]["accounts"] = [found[index] for index in sorted(found)]
+
+        if self.callback is not None:
+            self.callback(name, results[name])
+
+    # First stage : cheap and highly concurrent existence probe
+    # A request that fails (still throttled, connection errors...) is raised, the
+    # candidate has no verdict
+    async def _probe(self, name, service, username):
+        # Probe completed by the interrupted run being resumed
+        if self.journal is not None:
+            found, account = self.journal.get(name, username)
+            if found:
+                if account is not None and self.on_account is not None:
+                    self.on_account(name, account)
+                return account
+
+        # Outcome known from a previous run
+        if self.cache is not None and not self.refresh:
+            found, account = self.cache.get(
+                name,
+                username,
+                service.scrapes(),
+                service.cache_ttl,
+                service.cache_negative_ttl,
+            )
+            if found:
+                self._record(name, username, account)
+                if account is not None and self.on_account is not None:
+                    self.on_account(name, account)
+                return account
+
+        r = service.local_response(username)
+        if r is None:
+            try:
+                r = await self._request(
+                    service, service.fetch, username, service.fetch_key(username)
+                )
+            except (requests.RequestException, URLError) as error:
+                if not service.unreachable_missing or isinstance(error, Throttled):
+                    if service.report_errors:
+                        print("failed to connect to {}".format(name))
+                    raise
+
+        if r is None or not service.exists(r):
+            if self.cache is not None:
+                self.cache.put(name, username, None, service.scrapes())
+            self._record(name, username, None)
+            return None
+
+        account = service.parse(username, r)
+
+        # Most candidates miss, only the confirmed accounts reach the second stage
+        if service.scrapes():
+            try:
+                account = await self._enrich(name, service, username, r, account)
+            except asyncio.CancelledError:
+                # Out of time while waiting for the second stage, the account is
+                # confirmed, it is kept as in existence-only mode (the journal does
+                # not record it, a resumed run scrapes it)
+                if self.cache is not None:
+                    self.cache.put(name, username, account, False)
+                if self.on_account is not None:
+                    self.on_account(name, account)
+                return account
+
+        if self.cache is not None:
+            self.cache.put(name, username, account, service.scrapes())
+        self._record(name, username, account)
+
+        if self.on_account is not None:
+            self.on_account(name, account)
+
+        return account
+
+    # Outcome of a completed probe, kept in the journal of the run
+    def _record(self, name, username, account):
+        if self.journal is not None:
+            self.journal.record(name, username, account)
+
+    # Second stage : download and scrape the page of a confirmed account, with its
+    # own concurrency limit and parser workers
+    async def _enrich(self, name, service, username, r, account):
+        loop = asyncio.get_running_loop()
+
+        async with self.enrich_semaphore:
+            # The existence probe did not download the page
+            if service.probe is not None:
+                try:
+                    r = await self._request(
+                        service,
+                        service.fetch_page,
+                        username,
+                        ("get", service.probe_url(username)),
+                    )
+                except (requests.RequestException, URLError, HostUnavailable):
+                    return account
+
+            if self.archive is not None:
+                self.archive.put(name, username, r)
+
+            # A page the extractors can't handle (or a broken parser worker) keeps the
+            # account confirmed by the probe
+            parsers = self.parsers
+            try:
+                if parsers is None:
+                    return service.scrape(username, r)
+
+                # With the process backend, the service and the response (raw body
+                # included) are pickled and sent to a worker process
+                return await loop.run_in_executor(parsers, service.scrape, username, r)
+            except BrokenExecutor:
+                # A parser worker died, the pool is replaced for the next pages
+                if self.parsers is parsers:
+                    parsers.shutdown(wait=False, cancel_futures=True)
+                    self.parsers = self._parsers()
+                return account
+            except Exception:
+                return account
+
+    # Concurrent requests with the same key, e.g. the same URL probed by two services,
+    # are only sent once, every caller gets the same response
+    # Only the requests in flight are shared, a response is not kept once received
+    async def _request(self, service, fetch, username, key=None):
+        if key is None:
+            return await self._fetch(service, fetch, username)
+
+        if key not in self.fetches:
+            fetches = self.fetches
+            fetches[key] = asyncio.ensure_future(self._fetch(service, fetch, username))
+            fetches[key].add_done_callback(lambda _: fetches.pop(key, None))
+        # A caller running out of time does not cancel the request of the others
+        return await asyncio.shield(self.fetches[key])
+
+    async def _fetch(self, service, fetch, username):
+        if (
+            fetch == service.fetch
+            and self.hedge_ratio > 0
+            and service.mirrors is not None
+            and len(service.mirrors.healthy()) > 1
+        ):
+            return await self._hedged(service, username)
+        return await self._send(service, fetch, username)
+
+    # Probe the account on the fastest mirror, then on the next one if the first
+    # is slower than usual, the first answer wins and the other request is cancelled
+    async def _hedged(self, service, username):
+        primary, backup = service.mirrors.healthy()[:2]
+        sent = asyncio.Event()
+        first = asyncio.ensure_future(self._mirror(service, primary, username, sent))
+
+        # The request is slow from the time it is sent, not while it waits for a
+        # slot or a token of the host
+        waiting = asyncio.ensure_future(sent.wait())
+        await asyncio.wait({first, waiting}, return_when=asyncio.FIRST_COMPLETED)
+        waiting.cancel()
+
+        while True:
+            done, pending = await asyncio.wait(
+                {first}, timeout=service.mirrors.p90(primary)
+            )
+            if done:
+                return await first
+            # Each hedged request adds load, they are kept to a fraction of all
+            # requests, the budget grows as the run sends more of them
+            if self.hedges + 1 <= self.hedge_ratio * self.requests:
+                break
+
+        self.hedges += 1
+        second = asyncio.ensure_future(self._mirror(service, backup, username))
+        try:
+            done, pending = await asyncio.wait(
+                {first, second}, return_when=asyncio.FIRST_COMPLETED
+            )
+            winner = done.pop()
+            # The first answer is an error, the other request may still succeed
+            if winner.exception() is not None and pending:
+                return await pending.pop()
+            return winner.result()
+        finally:
+            first.cancel()
+            second.cancel()
+
+    # Probe the account on a mirror, the duration of the request is recorded
+    async def _mirror(self, service, mirror, username, sent=None):
+        url = service.mirror_url(mirror, username)
+        return await self._send(
+            service,
+            service.fetch_url,
+            url,
+            url=url,
+            sent=sent,
+            timed=lambda seconds: service.mirrors.record(mirror, seconds),
+        )
+
+    # Run a blocking request of a service in a worker thread, fetch(argument)
+    # The number of concurrent requests and their rate are limited per host (the one
+    # of url, the probed URL of the account by default), connection errors and
+    # timeouts are retried
+    # The sent event is set once the request is actually sent, timed(seconds) gets
+    # the duration of the requests answered by the site
+    async def _send(self, service, fetch, argument, url=None, sent=None, timed=None):
+        loop = asyncio.get_running_loop()
+        if url is None:
+            url = service.probe_url(argument)
+        host = urlparse(url).netloc
+
+        if host not in self.limits:
+            self.limits[host] = AdaptiveLimit(
+                self.max_per_host, self.max_per_host_limit
+            )
+        limit = self.limits[host]
+        breaker = self._breaker(host)
+
+        attempt = 0
+        throttles = 0
+        while True:
+            # The request failed or was throttled, exponential backoff with full jitter
+            retries = attempt + throttles
+            if retries > 0:
+                await asyncio.sleep(
+                    random.uniform(0, self.retry_backoff * 2 ** (retries - 1))
+                )
+
+            await limit.acquire()
+            try:
+                # Wait for a token of the host, requests to other hosts go on
+                await self.scheduler.acquire(host, service.delay)
+
+                if breaker is not None and not breaker.allow():
+                    raise HostUnavailable(host)
+
+                self.requests += 1
+                if sent is not None:
+                    sent.set()
+                error = None
+                seconds = None
+                try:
+                    r, seconds = await loop.run_in_executor(
+                        self.executor, timed_call, fetch, argument
+                    )
+                except RETRY_ERRORS:
+                    limit.decrease()
+                    if breaker is not None:
+                        breaker.failure()
+                    if attempt == self.retry_count:
+                        raise
+                    attempt += 1
+                    continue
+                # e.g. raise_for_status() of the service
+                except requests.HTTPError as e:
+                    error = e
+                    r = e.response
+                except BaseException:
+                    if breaker is not None:
+                        breaker.abort()
+                    raise
+            finally:
+                limit.release()
+
+            # Responses parsed by the service (e.g. a range of hashes) have no
+            # status, the site answered
+            status = getattr(r, "status_code", 200)
+
+            # A throttled request is retried later, its response is not a verdict
+            if status in THROTTLE_STATUSES:
+                limit.decrease(retry_after(r))
+                # A host answering 503 may be down, 429 means it is up
+                if breaker is not None:
+                    if status >= 500:
+                        breaker.failure()
+                    else:
+                        breaker.abort()
+                if throttles < self.throttle_retries:
+                    throttles += 1
+                    continue
+                raise Throttled("{} is throttling the requests".format(host))
+
+            if status >= 500:
+                if breaker is not None:
+                    breaker.failure()
+            else:
+                if breaker is not None:
+                    breaker.success()
+                if seconds is not None:
+                    limit.success(seconds)
+                    if timed is not None:
+                        timed(seconds)
+
+            if error is not None:
+                raise error
+            return r
+
+    # Circuit breaker of the host, None if they are disabled
+    def _breaker(self, host):
+        if not self.breaker_threshold:
+            return None
+        if host not in self.breakers:
+            self.breakers[host] = CircuitBreaker(
+                self.breaker_threshold, self.breaker_cooldown
+            )
+        return self.breakers[host]
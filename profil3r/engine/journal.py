@@ -0,0 +1,91 @@
+import json
+import os
+import threading
+
+
+# Append-only journal of a run, one JSON object per line
+# The first line describes the run (its profile, options...), then a line is
+# appended for every completed probe {"target", "service", "candidate", "account"}
+# and for every completed target of a batch {"target", "done": true}
+# Each line is flushed as soon as it is written, a run killed at any point can be
+# resumed from its journal
+class Journal:
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        # Target of the probes being recorded, None for a single target run
+        self.target = None
+        # Targets whose reports were generated
+        self.completed = set()
+        # {target: {(service, candidate): account}} of the targets not completed
+        self.outcomes = {}
+        self.lock = threading.Lock()
+        self.file = None
+        # The last line was cut by a crash, the next one starts on a new line
+        self.partial = False
+
+    # Read the journal of a previous run, returns the description of the run
+    def load(self):
+        run = None
+        line = ""
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                # The last line may have been cut by the crash
+                except ValueError:
+                    continue
+
+                if run is None:
+                    run = entry
+                elif entry.get("done"):
+                    self.completed.add(entry["target"])
+                    # The outcomes of a completed target are no longer needed
+                    self.outcomes.pop(entry["target"], None)
+                else:
+                    outcomes = self.outcomes.setdefault(entry["target"], {})
+                    outcomes[entry["service"], entry["candidate"]] = entry["account"]
+        self.partial = bool(line) and not line.endswith("\n")
+        return run
+
+    def write(self, entry):
+        with self.lock:
+            if self.file is None:
+                self.file = open(self.path, "a", encoding="utf-8")
+            if self.partial:
+                self.file.write("\n")
+                self.partial = False
+            self.file.write(json.dumps(entry) + "\n")
+            self.file.flush()
+
+    # Returns (True, account) if the probe was completed by the run, account is None
+    # if the candidate does not exist, (False, None) otherwise
+    def get(self, service, candidate):
+        outcomes = self.outcomes.get(self.target, {})
+        if (service, candidate) in outcomes:
+            return True, outcomes[service, candidate]
+        return False, None
+
+    def record(self, service, candidate, account):
+        self.write(
+            {
+                "target": self.target,
+                "service": service,
+                "candidate": candidate,
+                "account": account,
+            }
+        )
+
+    def done(self, target):
+        self.write({"target": target, "done": True})
+        self.completed.add(target)
+        self.outcomes.pop(target, None)
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
@@ -0,0 +1,98 @@
+import asyncio
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+
+import requests
+
+# Status codes of a host asking the client to slow down, the response says nothing
+# about the account
+THROTTLE_STATUSES = (429, 503)
+
+
+# Raised when a host keeps throttling the requests after every retry
+class Throttled(requests.RequestException):
+    pass
+
+
+# Number of seconds to wait given by the Retry-After header of the response (a
+# number of seconds or an HTTP date), None if there is none
+def retry_after(r):
+    value = r.headers.get("Retry-After") if r is not None else None
+    if not value:
+        return None
+
+    try:
+        return max(0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# Concurrency limit of a single host, adjusted to the way the host answers (AIMD)
+# The limit grows by one request every `limit` fast answers up to max_limit, and
+# is halved when the host throttles the requests or fails. A Retry-After of the
+# host holds every request to it until it expires
+class AdaptiveLimit:
+
+    def __init__(self, limit=1, max_limit=1):
+        self.limit = limit
+        self.max_limit = max(limit, max_limit)
+        self.active = 0
+        self.waiters = deque()
+        self.blocked_until = 0
+        # Fastest answer of the host, an answer twice as slow is a sign of congestion
+        self.baseline = None
+
+    async def acquire(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            wait = self.blocked_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            if self.active < int(self.limit):
+                self.active += 1
+                return
+
+            waiter = loop.create_future()
+            self.waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self.waiters:
+                    self.waiters.remove(waiter)
+                # The slot given to this waiter goes to the next one
+                elif waiter.done() and not waiter.cancelled():
+                    self.wake()
+                raise
+
+    def release(self):
+        self.active -= 1
+        self.wake()
+
+    # Let the waiters try to take the free slots
+    def wake(self):
+        for _ in range(max(0, int(self.limit) - self.active)):
+            if not self.waiters:
+                return
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+
+    # The host answered in latency seconds
+    def success(self, latency):
+        if self.baseline is None or latency < self.baseline:
+            self.baseline = latency
+        if latency <= 2 * self.baseline and self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1 / int(self.limit))
+            self.wake()
+
+    # The host throttled the request or failed, wait seconds before the next request
+    def decrease(self, wait=None):
+        self.limit = max(1, self.limit / 2)
+        if wait is not None:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + wait)
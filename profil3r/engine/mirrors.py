@@ -0,0 +1,141 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+# Health of the mirrors checked by the previous runs, kept in a JSON file
+# {pool: {"checked": timestamp, "latencies": {mirror: seconds}}}
+class MirrorState:
+
+    def __init__(self, path, ttl=3600):
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self.lock = threading.Lock()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    # Latencies of the healthy mirrors of the pool, None if they are unknown,
+    # expired or were checked for another list of mirrors
+    def get(self, name, mirrors):
+        entry = self.load().get(name)
+        if entry is None or time.time() - entry["checked"] > self.ttl:
+            return None
+        if sorted(entry["mirrors"]) != sorted(mirrors):
+            return None
+        return entry["latencies"]
+
+    def put(self, name, mirrors, latencies):
+        with self.lock:
+            state = self.load()
+            state[name] = {
+                "checked": time.time(),
+                "mirrors": list(mirrors),
+                "latencies": latencies,
+            }
+            # Written aside then renamed, concurrent runs never read a partial file,
+            # each one writes its own temporary file
+            # The state is only a hint, it is checked again when it can't be saved
+            try:
+                directory = os.path.dirname(self.path) or "."
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(state, f)
+                    os.replace(tmp, self.path)
+                except BaseException:
+                    os.remove(tmp)
+                    raise
+            except OSError:
+                pass
+
+
+# Mirror front-ends of a site (URL templates such as "https://nitter.net/{}")
+# Every mirror is checked concurrently with a tight timeout, the healthy ones are
+# ranked by latency and the result is kept in the MirrorState for the next runs
+class MirrorPool:
+
+    def __init__(
+        self, name, mirrors, health_account, session=requests, timeout=3, state=None
+    ):
+        self.name = name
+        self.mirrors = list(mirrors)
+        # Account known to exist, a healthy mirror answers 200 for it
+        self.health_account = health_account
+        self.session = session
+        self.timeout = timeout
+        self.state = state
+        # {mirror: seconds} of the healthy mirrors
+        self.latencies = {}
+        # {mirror: deque of seconds} of the recent requests to each mirror
+        self.recent = {}
+
+    # Seconds taken by the mirror to answer, None if it is down
+    def check(self, mirror):
+        start = time.monotonic()
+        try:
+            r = self.session.get(
+                mirror.format(self.health_account), timeout=self.timeout
+            )
+        except requests.RequestException:
+            return None
+        if r.status_code != 200:
+            return None
+        return time.monotonic() - start
+
+    # Check the mirrors unless their health is known, returns the healthy ones
+    def rank(self):
+        latencies = None
+        if self.state is not None:
+            latencies = self.state.get(self.name, self.mirrors)
+
+        if latencies is None:
+            latencies = {}
+            if self.mirrors:
+                with ThreadPoolExecutor(max_workers=len(self.mirrors)) as pool:
+                    for mirror, latency in zip(
+                        self.mirrors, pool.map(self.check, self.mirrors)
+                    ):
+                        if latency is not None:
+                            latencies[mirror] = latency
+            # Mirrors all down may be a transient failure (e.g. the network), they
+            # are checked again by the next run
+            if self.state is not None and latencies:
+                self.state.put(self.name, self.mirrors, latencies)
+
+        self.latencies = latencies
+        return self.healthy()
+
+    # Healthy mirrors, the fastest first
+    def healthy(self):
+        return sorted(self.latencies, key=self.latencies.get)
+
+    # Duration of a request to the mirror
+    def record(self, mirror, seconds):
+        if mirror not in self.recent:
+            self.recent[mirror] = deque(maxlen=100)
+        self.recent[mirror].append(seconds)
+
+    # 90th percentile of the recent requests to the mirror, from its health check
+    # until enough requests are known
+    def p90(self, mirror):
+        recent = sorted(self.recent.get(mirror, ()))
+        if len(recent) < 10:
+            return self.latencies.get(mirror, self.timeout) * 2
+        return recent[int(0.9 * (len(recent) - 1))]
+
+    # Fastest healthy mirror, None if they are all down
+    def best(self):
+        healthy = self.healthy()
+        return healthy[0] if healthy else None
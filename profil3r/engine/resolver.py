@@ -0,0 +1,52 @@
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Default lookup, raises socket.gaierror if the host does not resolve
+def getaddrinfo(host):
+    return socket.getaddrinfo(host, None)
+
+
+# Resolves many host names concurrently, with its own cache
+# Most generated domain names do not exist, resolving them in bulk first avoids an
+# HTTP request (and its connect timeout) for each of them
+class Resolver:
+
+    def __init__(self, workers=32, ttl=300, negative_ttl=60, lookup=getaddrinfo):
+        self.workers = workers
+        # Number of seconds a resolvable (respectively unresolvable) host is cached
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # lookup(host) returns the addresses of the host or raises OSError
+        self.lookup = lookup
+        # {host: (resolvable, expires)}
+        self.cache = {}
+        self.lock = threading.Lock()
+
+    def resolves(self, host):
+        with self.lock:
+            cached = self.cache.get(host)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        try:
+            resolvable = bool(self.lookup(host))
+        except (OSError, UnicodeError):
+            resolvable = False
+
+        ttl = self.ttl if resolvable else self.negative_ttl
+        with self.lock:
+            self.cache[host] = (resolvable, time.monotonic() + ttl)
+        return resolvable
+
+    # Returns the set of the hosts that resolve
+    def resolve_all(self, hosts):
+        hosts = list(dict.fromkeys(hosts))
+        if not hosts:
+            return set()
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(hosts))) as pool:
+            resolvable = pool.map(self.resolves, hosts)
+            return {host for host, ok in zip(hosts, resolvable) if ok}
@@ -0,0 +1,149 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+
+
+# Token bucket of a single host
+# rate : number of tokens added per second, capacity : maximum burst
+class TokenBucket:
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    # Take a token and return the number of seconds to wait before using it
+    # The bucket can go below zero, every caller is given its own turn in order
+    def reserve(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+
+        if self.tokens >= 0:
+            return 0
+        return -self.tokens / self.rate
+
+
+# Central scheduler keeping a token bucket per host
+# A request waiting for its host never blocks the requests to the other hosts
+class Scheduler:
+
+    def __init__(self):
+        self.buckets = {}
+
+    # delay is the minimum number of seconds between two requests to the host
+    # (the "rate_limit" of the service in the config/config.json file)
+    def bucket(self, host, delay):
+        rate = 1 / delay
+
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(rate)
+        # Services sharing a host get the most polite rate
+        elif rate < self.buckets[host].rate:
+            self.buckets[host].rate = rate
+
+        return self.buckets[host]
+
+    # Wait until a request to the host is allowed
+    async def acquire(self, host, delay):
+        # No rate limit
+        if delay <= 0:
+            return
+
+        wait = self.bucket(host, delay).reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+# Token buckets shared by every Profil3r process of the machine (concurrent command
+# line runs, the web UI...), kept in a SQLite database
+# The processes share a single rate per host instead of each applying its own
+# A bucket not used for max_age seconds is full again, it is removed from the database
+class SharedScheduler(Scheduler):
+
+    def __init__(self, path, max_age=3600):
+        super().__init__()
+        self.max_age = max_age
+        self.reserves = 0
+
+        path = os.path.expanduser(path)
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        with self.lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "host TEXT PRIMARY KEY, tokens REAL, updated REAL)"
+            )
+        self.prune()
+
+    # Take a token of the host and return the number of seconds to wait before using
+    # it, the bucket is read and updated in a single write transaction, the other
+    # processes wait for it (a few microseconds)
+    def reserve(self, host, delay):
+        rate = 1 / delay
+        capacity = 1
+
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.connection.execute(
+                    "SELECT tokens, updated FROM buckets WHERE host = ?", (host,)
+                ).fetchone()
+                # The clock is shared between the processes
+                now = time.time()
+                if row is None:
+                    tokens = capacity
+                else:
+                    tokens, updated = row
+                    tokens = min(capacity, tokens + max(0, now - updated) * rate)
+                tokens -= 1
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?)",
+                    (host, tokens, now),
+                )
+                self.connection.execute("COMMIT")
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.reserves += 1
+
+        if self.reserves % 1000 == 0:
+            self.prune()
+
+        if tokens >= 0:
+            return 0
+        return -tokens / rate
+
+    # Remove the buckets of the hosts not requested for max_age seconds, a missing
+    # bucket is a full one
+    def prune(self):
+        with self.lock:
+            self.connection.execute(
+                "DELETE FROM buckets WHERE updated < ?", (time.time() - self.max_age,)
+            )
+
+    async def acquire(self, host, delay):
+        # No rate limit
+        if delay <= 0:
+            return
+
+        # The transaction may wait for the other processes, it does not block the
+        # event loop
+        loop = asyncio.get_running_loop()
+        wait = await loop.run_in_executor(None, self.reserve, host, delay)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,32 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# HTTP session shared by every service
+# Connections are kept alive and pooled per host, so each probe to a host that was
+# already contacted reuses an open TCP/TLS connection instead of a new handshake
+class Session(requests.Session):
+
+    def __init__(
+        self, pool_connections=30, pool_maxsize=1, user_agent=None, timeout=None
+    ):
+        super().__init__()
+
+        # Default (connect, read) timeout of every request, a request without a
+        # timeout can hang forever on an unresponsive host
+        self.timeout = timeout
+
+        # pool_connections : number of hosts whose pool is kept open
+        # pool_maxsize : number of connections kept open for each host
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+        if user_agent is not None:
+            self.headers["User-Agent"] = user_agent
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
@@ -0,0 +1,112 @@
+import multiprocessing
+import os
+import time
+
+from .workqueue import WorkQueue, shard
+
+
+# Main loop of a worker process : probe the items of its shard until the queue is
+# closed and empty
+# build() returns the (engine, services) of the worker, built in the worker process
+def work(queue_path, index, build, batch=100, poll=0.05):
+    engine, services = build()
+    queue = WorkQueue(queue_path)
+
+    try:
+        while True:
+            items = queue.take(index, batch)
+            if not items:
+                if queue.closed():
+                    break
+                time.sleep(poll)
+                continue
+
+            outcomes = engine.probe_items(
+                services, [(service, candidate) for _, service, candidate in items]
+            )
+            queue.complete(
+                [
+                    (item[0], state, account)
+                    for item, (state, account) in zip(items, outcomes)
+                ]
+            )
+    finally:
+        queue.close()
+        engine.close()
+
+
+# Local worker processes consuming a WorkQueue, each one owns a shard of the hosts
+# The workers live as long as the pool, every search (e.g. every target of a batch)
+# is dispatched to them through the queue
+class WorkerPool:
+
+    def __init__(self, path, count, build, batch=100):
+        self.path = os.path.expanduser(path)
+        self.count = count
+        self.build = build
+        self.batch = batch
+        self.queue = None
+        self.processes = []
+        # The worker processes import the modules instead of inheriting the state
+        # (threads, SQLite connections...) of the coordinator
+        self.context = multiprocessing.get_context("spawn")
+
+    def start(self):
+        # A queue left by a previous run is discarded
+        self.remove()
+        self.queue = WorkQueue(self.path)
+        self.processes = [self.spawn(index) for index in range(self.count)]
+
+    def spawn(self, index):
+        process = self.context.Process(
+            target=work, args=(self.path, index, self.build, self.batch), daemon=True
+        )
+        process.start()
+        return process
+
+    # A worker that died is replaced, the items it had taken are probed again
+    def check(self):
+        for index, process in enumerate(self.processes):
+            if not process.is_alive() and process.exitcode != 0:
+                self.queue.release(index)
+                self.processes[index] = self.spawn(index)
+
+    # items is a list of (service, candidate, host), returns the (service, candidate,
+    # state, account) of every item in order, the items still pending when the
+    # deadline expires are cancelled
+    def run(self, target, items, deadline=None):
+        started = time.monotonic()
+        self.queue.put(
+            [
+                (target, service, candidate, shard(host, self.count))
+                for service, candidate, host in items
+            ]
+        )
+
+        while self.queue.remaining(target):
+            if deadline is not None and time.monotonic() - started > deadline:
+                self.queue.cancel(target)
+                break
+            self.check()
+            time.sleep(0.05)
+
+        results = list(self.queue.results(target))
+        self.queue.forget(target)
+        return results
+
+    def stop(self):
+        if self.queue is None:
+            return
+        self.queue.close_queue()
+        for process in self.processes:
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
+        self.queue.close()
+        self.queue = None
+        self.remove()
+
+    def remove(self):
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
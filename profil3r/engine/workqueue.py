@@ -0,0 +1,150 @@
+import json
+import os
+import sqlite3
+import threading
+import zlib
+
+# States of a work item
+PENDING = "pending"
+TAKEN = "taken"
+DONE = "done"
+CANCELLED = "cancelled"
+# The probe failed (connection error, throttled...), the candidate has no verdict
+FAILED = "failed"
+# The circuit breaker of the host is open, the candidate was not probed
+UNAVAILABLE = "unavailable"
+
+
+# Shard of a host, every candidate of a host goes to the same worker, which then owns
+# the rate limit and the connections of the host
+def shard(host, shards):
+    return zlib.crc32(host.encode("utf-8")) % shards
+
+
+# Work queue of a sharded run, kept in a SQLite database shared by the coordinator
+# and the worker processes
+# An item is a (target, service, candidate) probe, taken by the worker of its shard,
+# then done with the account found (or None), failed or unavailable
+class WorkQueue:
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        with self.lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS items ("
+                "id INTEGER PRIMARY KEY, target TEXT, service TEXT, candidate TEXT, "
+                "shard INTEGER, state TEXT, account TEXT)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS items_shard ON items (shard, state)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS items_target ON items (target, state)"
+            )
+            # A closed queue receives no more items, the workers stop once it is empty
+            self.connection.execute("CREATE TABLE IF NOT EXISTS queue (closed INTEGER)")
+
+    # items is a list of (target, service, candidate, shard)
+    def put(self, items):
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self.connection.executemany(
+                "INSERT INTO items (target, service, candidate, shard, state) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [item + (PENDING,) for item in items],
+            )
+            self.connection.execute("COMMIT")
+
+    # Take up to limit pending items of the shard, returns (id, service, candidate)
+    # triples, no other worker can take them
+    def take(self, shard, limit):
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                items = self.connection.execute(
+                    "SELECT id, service, candidate FROM items "
+                    "WHERE shard = ? AND state = ? ORDER BY id LIMIT ?",
+                    (shard, PENDING, limit),
+                ).fetchall()
+                self.connection.executemany(
+                    "UPDATE items SET state = ? WHERE id = ?",
+                    [(TAKEN, item[0]) for item in items],
+                )
+                self.connection.execute("COMMIT")
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+        return items
+
+    # outcomes is a list of (id, state, account), state is DONE, FAILED or UNAVAILABLE
+    def complete(self, outcomes):
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self.connection.executemany(
+                "UPDATE items SET state = ?, account = ? WHERE id = ?",
+                [(state, json.dumps(account), id) for id, state, account in outcomes],
+            )
+            self.connection.execute("COMMIT")
+
+    # The items taken by a worker that died are given to the next one of the shard
+    def release(self, shard):
+        with self.lock:
+            self.connection.execute(
+                "UPDATE items SET state = ? WHERE shard = ? AND state = ?",
+                (PENDING, shard, TAKEN),
+            )
+
+    # The pending items of the target are dropped (e.g. the deadline expired)
+    def cancel(self, target):
+        with self.lock:
+            self.connection.execute(
+                "UPDATE items SET state = ? WHERE target = ? AND state = ?",
+                (CANCELLED, target, PENDING),
+            )
+
+    # Number of items of the target not done yet
+    def remaining(self, target):
+        with self.lock:
+            (count,) = self.connection.execute(
+                "SELECT COUNT(*) FROM items WHERE target = ? AND state IN (?, ?)",
+                (target, PENDING, TAKEN),
+            ).fetchone()
+        return count
+
+    # (service, candidate, state, account) of every item of the target, in order
+    def results(self, target):
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT service, candidate, state, account FROM items "
+                "WHERE target = ? ORDER BY id",
+                (target,),
+            ).fetchall()
+        for service, candidate, state, account in rows:
+            yield service, candidate, state, (
+                json.loads(account) if account is not None else None
+            )
+
+    # The items of the target are no longer needed
+    def forget(self, target):
+        with self.lock:
+            self.connection.execute("DELETE FROM items WHERE target = ?", (target,))
+
+    def close_queue(self):
+        with self.lock:
+            self.connection.execute("INSERT INTO queue VALUES (1)")
+
+    def closed(self):
+        with self.lock:
+            return self.connection.execute("SELECT 1 FROM queue").fetchone() is not None
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
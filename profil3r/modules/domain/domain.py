@@ -1,9 +1,22 @@
-import time
+from itertools import islice
+from urllib.parse import urlparse
 
-import requests
+from profil3r.engine import Resolver
+from profil3r.modules.service import Service
 
 
-class Domain:
+class Domain(Service):
+
+    # domains are not case sensitive
+    case_sensitive = False
+
+    # Most of the candidates do not resolve
+    report_errors = False
+    # A domain name without a web server is not a registered one
+    unreachable_missing = True
+
+    # DNS resolver shared by the services, with its own cache
+    resolver = None
 
     def __init__(self, config, permutations_list):
         # 100 ms
@@ -12,38 +25,45 @@ class Domain:
         self.format = config["plateform"]["domain"]["format"]
         # Top level domains
         self.tld = config["plateform"]["domain"]["TLD"]
-        # domains are not case sensitive
-        self.permutations_list = [perm.lower() for perm in permutations_list]
+        self.permutations_list = permutations_list
         # domain
         self.type = config["plateform"]["domain"]["type"]
 
-    # Generate all potential domains names
-    def possible_domains(self):
-        possible_domains = []
+        # Candidates whose name resolves, set by setup()
+        self.resolvable = None
 
+    # Generate all potential domains names, lazily
+    def possible_domains(self):
         # search all TLD (.com, .net, .org...), you can add more in the config/config.json file
-        for domain in self.tld:
-            for permutation in self.permutations_list:
-                possible_domains.append(
-                    self.format.format(permutation=permutation, domain=domain)
-                )
-
-        return possible_domains
-
-    def search(self):
-        domains_lists = {"type": self.type, "accounts": []}
-        possible_domains_list = self.possible_domains()
-
-        r = None
-        for domain in possible_domains_list:
-            try:
-                r = requests.head(domain, timeout=5)
-            except requests.ConnectionError:
-                pass
-
-            # If the domain exists
-            if r is not None and r.status_code < 400:
-                domains_lists["accounts"].append({"value": domain})
-            time.sleep(self.delay)
-
-        return domains_lists
+        # Ranked permutations first, on every TLD
+        for permutation in self.canonical_permutations():
+            for domain in self.tld:
+                yield self.format.format(permutation=permutation, domain=domain)
+
+    # Every candidate probed is resolved in bulk before any HTTP request
+    def setup(self):
+        resolver = self.resolver if self.resolver is not None else Resolver()
+        self.resolvable = resolver.resolve_all(
+            urlparse(domain).hostname
+            for domain in islice(self.possible_domains(), self.max_candidates)
+        )
+
+    # Only the domains that resolve are checked with a HEAD request
+    def candidates(self):
+        if self.resolvable is None:
+            return self.possible_domains()
+        return (
+            domain
+            for domain in islice(self.possible_domains(), self.max_candidates)
+            if urlparse(domain).hostname in self.resolvable
+        )
+
+    def fetch(self, domain):
+        return self.session.head(domain)
+
+    def fetch_key(self, domain):
+        return ("head", domain)
+
+    # If the domain exists
+    def exists(self, r):
+        return r.status_code < 400
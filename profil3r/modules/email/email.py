@@ -1,9 +1,13 @@
-import time
+import hashlib
 
-import pwnedpasswords
+from profil3r.modules.email.ranges import RangeCache, parse_range
+from profil3r.modules.service import Service
 
 
-class Email:
+class Email(Service):
+
+    # email adresses are not case sensitive
+    case_sensitive = False
 
     def __init__(self, config, permutations_list):
         # Have I been pwned API rate limit ( 1500 ms)
@@ -13,41 +17,73 @@ class Email:
         self.domains = config["plateform"]["email"]["domains"]
         # {username}@{domain}
         self.format = config["plateform"]["email"]["format"]
-        # email adresses are not case sensitive
-        self.permutations_list = [perm.lower() for perm in permutations_list]
+        self.permutations_list = permutations_list
         # email
         self.type = config["plateform"]["email"]["type"]
+        # k-anonymity range API, only the first 5 characters of the SHA-1 of an adress
+        # are sent, the API answers every suffix of this prefix
+        self.range_url = config["plateform"]["email"].get(
+            "range_url", "https://api.pwnedpasswords.com/range/{}"
+        )
+        # Ranges already fetched are kept on disk
+        self.range_cache = RangeCache(
+            config["plateform"]["email"].get(
+                "range_cache_path", "~/.cache/profil3r/ranges"
+            ),
+            ttl=config["plateform"]["email"].get("range_cache_ttl", 86400),
+        )
+        # {prefix: {suffix: count}} of the ranges known by the run
+        self.ranges = {}
 
-    # Generate all potential adresses
+    # Generate all potential adresses, lazily
     def possible_emails(self):
-        possible_emails = []
-
-        for domain in self.domains:
-            for permutation in self.permutations_list:
-                possible_emails.append(
-                    self.format.format(permutation=permutation, domain=domain)
-                )
-        return possible_emails
-
-    # We use the Have I Been Pwned API to search for breached emails
-    def search(self):
-        emails_usernames = {"type": self.type, "accounts": []}
-        possible_emails_list = self.possible_emails()
-
-        for possible_email in possible_emails_list:
-            pwned = pwnedpasswords.check(possible_email)
-
-            # Not breached email
-            if not pwned:
-                emails_usernames["accounts"].append(
-                    {"value": possible_email, "breached": False}
-                )
-            # Breached emails
-            else:
-                emails_usernames["accounts"].append(
-                    {"value": possible_email, "breached": True}
-                )
-
-            time.sleep(self.delay)
-
-        return emails_usernames
+        # Ranked permutations first, on every domain
+        for permutation in self.canonical_permutations():
+            for domain in self.domains:
+                yield self.format.format(permutation=permutation, domain=domain)
+
+    def candidates(self):
+        return self.possible_emails()
+
+    # (prefix, suffix) of the SHA-1 of an adress
+    def hash(self, possible_email):
+        digest = hashlib.sha1(possible_email.encode("utf-8")).hexdigest().upper()
+        return digest[:5], digest[5:]
+
+    def probe_url(self, possible_email):
+        return self.range_url.format(self.hash(possible_email)[0])
+
+    # Range known without any request, the range of a prefix is read from the disk
+    # the first time a candidate needs it, the others are fetched once by the engine
+    # for all the candidates sharing the prefix
+    def local_response(self, possible_email):
+        prefix = self.hash(possible_email)[0]
+        if prefix not in self.ranges:
+            body = self.range_cache.get(prefix)
+            if body is None:
+                return None
+            self.ranges[prefix] = parse_range(body)
+        return self.ranges[prefix]
+
+    # The range is the same for every candidate of the prefix
+    def fetch_key(self, possible_email):
+        return ("get", self.probe_url(possible_email))
+
+    # We use the Have I Been Pwned range API to search for breached emails
+    def fetch(self, possible_email):
+        prefix, suffix = self.hash(possible_email)
+
+        r = self.session.get(self.range_url.format(prefix))
+        r.raise_for_status()
+
+        self.range_cache.put(prefix, r.text)
+        self.ranges[prefix] = parse_range(r.text)
+        return self.ranges[prefix]
+
+    # Every candidate is reported, breached or not
+    def exists(self, suffixes):
+        return True
+
+    def parse(self, possible_email, suffixes):
+        prefix, suffix = self.hash(possible_email)
+        return {"value": possible_email, "breached": suffix in suffixes}
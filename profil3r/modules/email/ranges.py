@@ -0,0 +1,50 @@
+import os
+import tempfile
+import time
+
+
+# Ranges of the k-anonymity API kept on disk, one file per SHA-1 prefix
+# A range is reused for ttl seconds, whatever candidate it was fetched for
+class RangeCache:
+
+    def __init__(self, path, ttl=86400):
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        os.makedirs(self.path, exist_ok=True)
+
+    # Body of the range, None if it is not cached or expired
+    def get(self, prefix):
+        path = os.path.join(self.path, prefix)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    # Written aside then renamed, a concurrent reader never sees a partial range,
+    # each writer has its own temporary file
+    # A range that can't be saved is fetched again by the next run
+    def put(self, prefix, body):
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(body)
+                os.replace(tmp, os.path.join(self.path, prefix))
+            except BaseException:
+                os.remove(tmp)
+                raise
+        except OSError:
+            pass
+
+
+# {SHA-1 suffix: count} of a range body, one "SUFFIX:COUNT" per line
+def parse_range(body):
+    suffixes = {}
+    for line in body.splitlines():
+        suffix, _, count = line.strip().partition(":")
+        if suffix:
+            suffixes[suffix.upper()] = int(count or 0)
+    return suffixes
@@ -1,9 +1,7 @@
-import time
+from profil3r.modules.service import Service
 
-import requests
 
-
-class Dailymotion:
+class Dailymotion(Service):
 
     def __init__(self, config, permutations_list):
         # 1000 ms
@@ -13,32 +11,3 @@ class Dailymotion:
         self.permutations_list = permutations_list
         # entertainment
         self.type = config["plateform"]["dailymotion"]["type"]
-
-    # Generate all potential dailymotion usernames
-    def possible_usernames(self):
-        possible_usernames = []
-
-        for permutation in self.permutations_list:
-            possible_usernames.append(
-                self.format.format(
-                    permutation=permutation,
-                )
-            )
-        return possible_usernames
-
-    def search(self):
-        dailymotion_usernames = {"type": self.type, "accounts": []}
-        possible_usernames_list = self.possible_usernames()
-
-        for username in possible_usernames_list:
-            try:
-                r = requests.get(username)
-            except requests.ConnectionError:
-                print("failed to connect to dailymotion")
-
-            # If the account exists
-            if r.status_code == 200:
-                dailymotion_usernames["accounts"].append({"value": username})
-            time.sleep(self.delay)
-
-        return dailymotion_usernames
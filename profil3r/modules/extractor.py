@@ -0,0 +1,169 @@
+import re
+from functools import lru_cache
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+# lxml is much faster than the builtin parser, it is used when installed
+try:
+    import lxml  # noqa: F401
+
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+SELECTOR_PART = re.compile(r"\.([\w-]+)|#([\w-]+)|\[([\w-]+)=([^\]]+)\]")
+
+
+# Simple CSS selector : tag, .class, #id and [attribute=value], e.g.
+# "li[itemprop=twitter]" or ".text-bold.color-text-primary"
+class Selector:
+
+    def __init__(self, selector):
+        match = re.match(r"[\w-]*", selector)
+        self.selector = selector
+        self.tag = match.group() or None
+        self.classes = set()
+        self.attrs = {}
+
+        for css_class, css_id, attr, value in SELECTOR_PART.findall(
+            selector[match.end() :]
+        ):
+            if css_class:
+                self.classes.add(css_class)
+            elif css_id:
+                self.attrs["id"] = css_id
+            else:
+                self.attrs[attr] = value
+
+    # attrs are the raw attributes while parsing, the class is then a string
+    def match(self, name, attrs):
+        if self.tag is not None and name != self.tag:
+            return False
+
+        for attr, value in self.attrs.items():
+            if attrs.get(attr) != value:
+                return False
+
+        if self.classes:
+            classes = attrs.get("class") or ()
+            if isinstance(classes, str):
+                classes = classes.split()
+            if not self.classes.issubset(classes):
+                return False
+
+        return True
+
+
+# Value of an element
+def text(element):
+    return str(element.get_text()).strip()
+
+
+# Text on a single line
+def oneline(element):
+    return " ".join(element.get_text().split())
+
+
+# Count without the thousands separators
+def number(element):
+    return str(element.get_text().replace(",", "")).strip()
+
+
+# Information of an account, declared once by the service
+# selector : elements holding the information, index : the one to use (None for the
+# list of all of them), child : selector of the element inside it, child_index : the
+# one to use, value : function returning the value from the element
+# A field without key returns a dict of informations, merged into the account
+class Field:
+
+    def __init__(
+        self, key, name, selector, index=0, child=None, child_index=0, value=text
+    ):
+        self.key = key
+        self.name = name
+        self.selector = Selector(selector)
+        self.index = index
+        self.child = Selector(child) if child is not None else None
+        self.child_index = child_index
+        self.value = value
+
+    def extract(self, elements):
+        try:
+            if self.index is None:
+                return self.value(elements)
+
+            element = elements[self.index]
+            if self.child is not None:
+                element = [
+                    descendant
+                    for descendant in element.descendants
+                    if isinstance(descendant, Tag)
+                    and self.child.match(descendant.name, descendant.attrs)
+                ][self.child_index]
+            return self.value(element)
+        except (IndexError, KeyError, AttributeError, ValueError):
+            return None
+
+
+# Only keep the elements matching one of the selectors, with their content
+# Every other element of the page is skipped while parsing
+class Strainer(SoupStrainer):
+
+    def __init__(self, selectors):
+        super().__init__()
+        self.selectors = selectors
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return any(selector.match(name, attrs or {}) for selector in self.selectors)
+
+    def allow_string_creation(self, string):
+        return False
+
+    # beautifulsoup4 < 4.13
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        return self.allow_tag_creation(None, markup_name, dict(markup_attrs))
+
+    def search(self, markup):
+        if isinstance(markup, Tag):
+            return self.search_tag(markup.name, markup.attrs)
+
+
+# Fields of a service compiled once : each page is parsed a single time, keeping only
+# the elements of the fields, then every field is matched in a single traversal
+class Extractor:
+
+    def __init__(self, fields):
+        self.fields = fields
+
+        # Fields sharing a selector share its matches
+        self.selectors = {}
+        for field in fields:
+            self.selectors.setdefault(field.selector.selector, field.selector)
+        self.strainer = Strainer(list(self.selectors.values()))
+
+    def parse(self, html):
+        return BeautifulSoup(html, PARSER, parse_only=self.strainer)
+
+    # Returns {key: {"name": ..., "value": ...}}
+    def extract(self, html):
+        matches = {selector: [] for selector in self.selectors}
+
+        for element in self.parse(html).descendants:
+            if isinstance(element, Tag):
+                for selector, compiled in self.selectors.items():
+                    if compiled.match(element.name, element.attrs):
+                        matches[selector].append(element)
+
+        informations = {}
+        for field in self.fields:
+            value = field.extract(matches[field.selector.selector])
+            if field.key is None:
+                informations.update(value or {})
+            else:
+                informations[field.key] = {"name": field.name, "value": value}
+        return informations
+
+
+@lru_cache(maxsize=None)
+def compile_fields(fields):
+    return Extractor(fields)
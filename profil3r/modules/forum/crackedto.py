@@ -1,9 +1,7 @@
-import time
+from profil3r.modules.service import Service
 
-import requests
 
-
-class CrackedTo:
+class CrackedTo(Service):
 
     def __init__(self, config, permutations_list):
         # 1000 ms
@@ -14,32 +12,3 @@ class CrackedTo:
         self.permutations_list = permutations_list
         # forum
         self.type = config["plateform"]["crackedto"]["type"]
-
-    # Generate all potential cracked.to usernames
-    def possible_usernames(self):
-        possible_usernames = []
-
-        for permutation in self.permutations_list:
-            possible_usernames.append(
-                self.format.format(
-                    permutation=permutation,
-                )
-            )
-        return possible_usernames
-
-    def search(self):
-        cracked_usernames = {"type": self.type, "accounts": []}
-        possible_usernames_list = self.possible_usernames()
-
-        for username in possible_usernames_list:
-            try:
-                r = requests.get(username)
-            except requests.ConnectionError:
-                print("failed to connect to cracked.to")
-
-            # If the account exists
-            if r.status_code == 200:
-                cracked_usernames["accounts"].append({"value": username})
-            time.sleep(self.delay)
-
-        return cracked_usernames
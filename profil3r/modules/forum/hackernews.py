@@ -1,10 +1,14 @@
-import time
+from profil3r.modules.extractor import Field
+from profil3r.modules.service import Service
 
-import requests
-from bs4 import BeautifulSoup
 
+class Hackernews(Service):
 
-class Hackernews:
+    # Informations scraped from the page of an account
+    fields = (
+        Field("creation_date", "Creation Date", "table", 2, child="td", child_index=3),
+        Field("karma", "Karma", "table", 2, child="td", child_index=5),
+    )
 
     def __init__(self, config, permutations_list):
         # 1000 ms
@@ -16,67 +20,6 @@ class Hackernews:
         # forum
         self.type = config["plateform"]["hackernews"]["type"]
 
-    # Generate all potential hackernews usernames
-    def possible_usernames(self):
-        possible_usernames = []
-
-        for permutation in self.permutations_list:
-            possible_usernames.append(
-                self.format.format(
-                    permutation=permutation,
-                )
-            )
-        return possible_usernames
-
-    def search(self):
-        hackernews_usernames = {"type": self.type, "accounts": []}
-        possible_usernames_list = self.possible_usernames()
-
-        for username in possible_usernames_list:
-            try:
-                r = requests.get(username)
-            except requests.ConnectionError:
-                print("failed to connect to hackernews")
-
-            # If the account exists
-            if r.text.find("No such user.") != 0:
-                # Account object
-                account = {}
-
-                # Get the username
-                account["value"] = username
-
-                # Parse HTML response content with beautiful soup
-                soup = BeautifulSoup(r.text, "html.parser")
-
-                # Scrape the user informations
-                try:
-                    user_creation_date = (
-                        str(
-                            soup.find_all("table")[2].find_all("td")[3].get_text()
-                        ).strip()
-                        if soup.find_all("table")
-                        else None
-                    )
-                    user_karma = (
-                        str(
-                            soup.find_all("table")[2].find_all("td")[5].get_text()
-                        ).strip()
-                        if soup.find_all("table")
-                        else None
-                    )
-
-                    account["creation_date"] = {
-                        "name": "Creation Date",
-                        "value": user_creation_date,
-                    }
-                    account["karma"] = {"name": "Karma", "value": user_karma}
-                except:
-                    pass
-
-                # Append the account to the accounts table
-                hackernews_usernames["accounts"].append(account)
-
-            time.sleep(self.delay)
-
-        return hackernews_usernames
+    # If the account exists
+    def exists(self, r):
+        return r.text.find("No such user.") != 0
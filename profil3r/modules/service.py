@@ -0,0 +1,243 @@
+import re
+
+import requests
+
+from profil3r.engine.mirrors import MirrorPool
+from profil3r.modules.extractor import compile_fields
+
+
+# Base class of all the services
+# The engine calls these methods to probe every candidate URL of a service
+class Service:
+
+    # Print an error message when a candidate can't be reached
+    report_errors = True
+
+    # A candidate that can't be reached (connection error, timeout) does not exist,
+    # otherwise it has no verdict and the search of the site is incomplete
+    unreachable_missing = False
+
+    # HTTP session, replaced by the pooled session of the Core
+    session = requests
+
+    # Maximum number of seconds spent on the service, None for no limit
+    budget = None
+
+    # Cheap existence check supported by the site, from the "probe" key of the
+    # service config : "head" (HEAD request) or "stream" (GET request closed as soon
+    # as the headers are received), None to download the whole page
+    probe = None
+
+    # Number of bytes of the body read by a "stream" probe, the connection of a
+    # response whose body is longer can't be reused
+    stream_limit = 8192
+
+    # Existence-only mode, the informations of the accounts are not scraped
+    existence_only = False
+
+    # Informations scraped from the page of an account, a tuple of Field
+    fields = None
+
+    # Mirror front-ends the accounts are looked up on (a MirrorPool), set by setup()
+    # None if the site is probed directly
+    mirrors = None
+
+    # Health of the mirrors kept between the runs (a MirrorState), set by the Core
+    mirror_state = None
+
+    # Timeout of the health check of a mirror, in seconds
+    mirror_timeout = 3
+
+    # Number of seconds the outcome of a probe is cached, None for the default of the
+    # cache, cache_negative_ttl applies to the candidates that do not exist
+    cache_ttl = None
+    cache_negative_ttl = None
+
+    # Only the max_candidates most likely candidates are probed, the search stops
+    # after max_hits accounts are found, None for no limit
+    max_candidates = None
+    max_hits = None
+
+    # Usernames of the site are case sensitive, from the "case_sensitive" key of the
+    # service config
+    case_sensitive = True
+
+    # Characters allowed in the usernames of the site, a regex character set such as
+    # "A-Za-z0-9_", from the "allowed_characters" key of the service config
+    # None to allow any character
+    allowed_characters = None
+
+    # Permutations valid on the site, in their canonical form and without duplicates
+    # e.g. "JohnDoe" and "johndoe" are a single candidate on a case insensitive site
+    # Generated lazily in the order of the ranked permutations
+    def canonical_permutations(self):
+        seen = set()
+
+        if self.allowed_characters is not None:
+            allowed = re.compile("[{}]+".format(self.allowed_characters))
+
+        for permutation in self.permutations_list:
+            if not self.case_sensitive:
+                permutation = permutation.lower()
+            # Drop the usernames the site rejects
+            if self.allowed_characters is not None and not allowed.fullmatch(
+                permutation
+            ):
+                continue
+            if permutation not in seen:
+                seen.add(permutation)
+                yield permutation
+
+    # The pooled session, the resolver and the mirrors hold sockets and locks and the
+    # permutations are generated from the profile, they are not sent to the parser
+    # worker processes, scrape() does not use them
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in (
+            "session",
+            "resolver",
+            "mirror_state",
+            "mirrors",
+            "permutations_list",
+        ):
+            state.pop(name, None)
+        return state
+
+    # Generate all potential usernames, lazily
+    def possible_usernames(self):
+        for permutation in self.canonical_permutations():
+            yield self.format.format(
+                permutation=permutation,
+            )
+
+    # Candidates probed by the engine
+    def candidates(self):
+        return self.possible_usernames()
+
+    # Called once, in a worker thread, before the candidates are probed
+    def setup(self):
+        pass
+
+    # Check the mirror front-ends of the site concurrently, returns the fastest
+    # healthy one
+    # No candidate can be probed if they are all down, the service is unavailable
+    def use_mirrors(self, mirrors, health_account):
+        name = type(self).__name__.lower()
+        self.mirrors = MirrorPool(
+            name,
+            mirrors,
+            health_account,
+            session=self.session,
+            timeout=self.mirror_timeout,
+            state=self.mirror_state,
+        )
+        self.mirrors.rank()
+        best = self.mirrors.best()
+        if best is None:
+            raise requests.ConnectionError("no working mirror of {}".format(name))
+        return best
+
+    # URL of the account on a mirror front-end
+    def mirror_url(self, mirror, username):
+        return mirror.format(username)
+
+    # URL actually requested to know if the account exists
+    def probe_url(self, username):
+        return username
+
+    # True if the informations of the accounts are scraped from the page body
+    def scrapes(self):
+        scrapes = self.fields is not None or type(self).scrape is not Service.scrape
+        return scrapes and not self.existence_only
+
+    # Existence probe, blocking request run by the engine in a worker thread
+    def fetch(self, username):
+        return self.fetch_url(self.probe_url(username))
+
+    # Existence probe of a URL, with the probe method of the site
+    def fetch_url(self, url):
+        if self.probe == "head":
+            return self.session.head(url, allow_redirects=True)
+        if self.probe == "stream":
+            r = self.session.get(url, stream=True)
+
+            # A short body is read entirely, the connection then goes back to the
+            # pool, a longer one is not downloaded and its connection is closed
+            content = b""
+            for chunk in r.iter_content(1024):
+                content += chunk
+                if len(content) > self.stream_limit:
+                    break
+            else:
+                r._content = content
+            r.close()
+            return r
+
+        return self.session.get(url)
+
+    # Response known without any request (e.g. cached by the service), None to send
+    # the request of fetch()
+    def local_response(self, username):
+        return None
+
+    # Identifies the request sent by fetch(), the services probing the same URL the
+    # same way share a single request, None if the response can't be shared
+    def fetch_key(self, username):
+        return (self.probe or "get", self.probe_url(username))
+
+    # Download the whole page of a confirmed account, for scrape()
+    def fetch_page(self, username):
+        return self.session.get(self.probe_url(username))
+
+    # If the account exists
+    def exists(self, r):
+        return r.status_code == 200
+
+    # Scrape the informations of an existing account
+    def scrape(self, username, r):
+        account = {"value": username}
+
+        # The fields are compiled once for all the pages of the service
+        if self.fields is not None:
+            account.update(compile_fields(self.fields).extract(r.text))
+
+        return account
+
+    # Account of an existing candidate, from the response of the existence probe
+    def parse(self, username, r):
+        return {"value": username}
+
+    # Search a single service, returns {"type": ..., "accounts": [...]}
+    def search(self):
+        from profil3r.engine import Engine
+
+        name = type(self).__name__.lower()
+        engine = Engine()
+        try:
+            return engine.run({name: self})[name]
+        finally:
+            engine.close()
+
+    # Iterator variant of search(), yields each account as soon as it is confirmed
+    def stream(self):
+        from profil3r.engine import Engine
+
+        engine = Engine()
+        try:
+            for name, account in engine.stream({type(self).__name__.lower(): self}):
+                yield account
+        finally:
+            engine.close()
+
+    # Async iterator variant of search()
+    async def astream(self):
+        from profil3r.engine import Engine
+
+        engine = Engine()
+        try:
+            async for name, account in engine.astream(
+                {type(self).__name__.lower(): self}
+            ):
+                yield account
+        finally:
+            engine.close()
@@ -1,9 +1,7 @@
-import time
+from profil3r.modules.service import Service
 
-import requests
 
-
-class Skype:
+class Skype(Service):
 
     def __init__(self, config, permutations_list):
         # 1000 ms
@@ -14,36 +12,18 @@ class Skype:
         # tchat
         self.type = config["plateform"]["skype"]["type"]
 
-    # Generate all potential skype usernames
-    def possible_usernames(self):
-        possible_usernames = []
-
-        for permutation in self.permutations_list:
-            possible_usernames.append(
-                self.format.format(
-                    permutation=permutation,
-                )
-            )
-        return possible_usernames
-
-    def search(self):
-        skype_usernames = {"type": self.type, "accounts": []}
-
-        skypli_URL = "https://www.skypli.com/profile/{}"
-
-        possible_usernames_list = self.possible_usernames()
-
-        for username in possible_usernames_list:
-            try:
-                skypli_formatted_URL = skypli_URL.format(username)
-                r = requests.get(skypli_formatted_URL)
-            except requests.ConnectionError:
-                print("failed to connect to skype")
+        # Skypli mirrors, you can add more in the "mirrors" key of the
+        # config/config.json file
+        self.skypli_URL = config["plateform"]["skype"].get(
+            "mirrors", ["https://www.skypli.com/profile/{}"]
+        )
 
-            # If the account exists
-            if r.status_code == 200:
-                skype_usernames["accounts"].append({"value": username})
+        # Fastest working skypli mirror, set by setup()
+        self.skypli_instance = None
 
-            time.sleep(self.delay)
+    def setup(self):
+        self.skypli_instance = self.use_mirrors(self.skypli_URL, "echo123")
 
-        return skype_usernames
+    # Skype profiles are looked up on skypli
+    def probe_url(self, username):
+        return self.mirror_url(self.skypli_instance, username)
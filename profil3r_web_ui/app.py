@@ -1,13 +1,16 @@
+import json
 import os
 import sys
 import uuid
 
 from flask import (
     Flask,
+    Response,
     redirect,
     render_template,
     request,
     send_from_directory,
+    stream_with_context,
     url_for,
 )
 
@@ -141,6 +144,41 @@ def run_profil3r_route():  # Renamed to avoid conflict if 'run_profil3r' is a fu
         )
 
 
+@app.route("/stream", methods=["POST"])
+def stream_profil3r_route():
+    # Streams the accounts as newline-delimited JSON as soon as they are found,
+    # the last line gives the filename of the HTML report
+    profiles_list = [
+        item.strip()
+        for line in request.form.get("profiles", "").splitlines()
+        for item in line.split(" ")
+        if item.strip()
+    ]
+    if not profiles_list:
+        return Response(
+            json.dumps({"error": "No profiles provided."}) + "\n",
+            status=400,
+            mimetype="application/x-ndjson",
+        )
+
+    report_basename = f"profil3r_report_{uuid.uuid4().hex}.html"
+    report_output_filepath = os.path.join(app.config["REPORTS_DIR"], report_basename)
+
+    def generate():
+        core_instance = Core(config_path=PROFIL3R_CONFIG_PATH)
+        try:
+            for service, account in core_instance.stream(profiles_list):
+                yield json.dumps({"service": service, "account": account}) + "\n"
+
+            core_instance.generate_report(html_output_filepath=report_output_filepath)
+            yield json.dumps({"report_filename": report_basename}) + "\n"
+        except Exception as e:
+            print(f"An unexpected error occurred during Profil3r execution: {e}")
+            yield json.dumps({"error": str(e)}) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
 @app.route("/reports/<filename>")
 def download_report(filename):
     return send_from_directory(app.config["REPORTS_DIR"], filename, as_attachment=True)
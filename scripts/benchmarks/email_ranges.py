@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the email module against a local range server.
+
+Compares the previous approach (one range request per candidate, then a sleep
+of the rate limit) with the batched module: one request per SHA-1 prefix, ranges kept in a disk cache (cold then warm run).
+Usage: python scripts/benchmarks/email_ranges.py [--delay S] [--latency S]
+"""
+
+import argparse
+import hashlib
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from range_server import RangeServer  # noqa: E402
+
+from profil3r.core._permutations import permutations  # noqa: E402
+from profil3r.engine import Engine  # noqa: E402
+from profil3r.modules.email.email import Email  # noqa: E402
+
+DOMAINS = ["gmail.com", "yahoo.com", "hotmail.com"]
+
+
+def previous_search(candidates, range_url, delay):
+    """Previous approach: one lookup per candidate, sequential."""
+    breached = []
+    for candidate in candidates:
+        digest = hashlib.sha1(candidate.encode("utf-8")).hexdigest().upper()
+        r = requests.get(range_url.format(digest[:5]))
+        if digest[5:] in r.text:
+            breached.append(candidate)
+        time.sleep(delay)
+    return breached
+
+
+def batched_search(config, permutations_list):
+    email = Email(config, permutations_list)
+    result = Engine(max_per_host=4).run({"email": email})["email"]
+    return [account["value"] for account in result["accounts"] if account["breached"]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tokens", nargs="+", default=["john", "doe", "jr"])
+    parser.add_argument("--delay", type=float, default=0.05)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    permutations_list = list(permutations(args.tokens, [".", "-", "_"]))
+    candidates = [
+        "{}@{}".format(permutation, domain)
+        for permutation in permutations_list
+        for domain in DOMAINS
+    ]
+    server = RangeServer(
+        latency=args.latency, breached=[candidates[0], candidates[-1]]
+    ).start()
+
+    with tempfile.TemporaryDirectory() as cache:
+        config = {
+            "plateform": {
+                "email": {
+                    "rate_limit": args.delay * 1000,
+                    "domains": DOMAINS,
+                    "format": "{permutation}@{domain}",
+                    "type": "email",
+                    "range_url": server.range_url,
+                    "range_cache_path": cache,
+                }
+            }
+        }
+        prefixes = len({hashlib.sha1(c.encode()).hexdigest()[:5] for c in candidates})
+        print(f"{len(candidates)} candidates, {prefixes} distinct prefixes")
+        print(f"{'approach':<18} {'requests':>9} {'time (s)':>9} {'breached':>9}")
+
+        runs = [
+            (
+                "previous",
+                lambda: previous_search(candidates, server.range_url, args.delay),
+            ),
+            ("batched (cold)", lambda: batched_search(config, permutations_list)),
+            ("batched (warm)", lambda: batched_search(config, permutations_list)),
+        ]
+        for label, run in runs:
+            server.requests.clear()
+            start = time.perf_counter()
+            breached = run()
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:<18} {len(server.requests):>9} {elapsed:>9.2f} "
+                f"{len(breached):>9}"
+            )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
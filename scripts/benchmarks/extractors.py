@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the field extractors of the scraping modules.
+
+Compares, on a synthetic profile page of each module, the previous approach
+(html.parser and a find_all scan of the whole document for every field access)
+with the compiled extractors (a single strained parse and traversal).
+Usage: python scripts/benchmarks/extractors.py [--repeat N] [--filler N]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from profil3r.modules.extractor import compile_fields  # noqa: E402
+from profil3r.modules.forum.hackernews import Hackernews  # noqa: E402
+from profil3r.modules.forum.jeuxvideo import JeuxVideo  # noqa: E402
+from profil3r.modules.forum.lesswrong import LessWrong  # noqa: E402
+from profil3r.modules.hosting.aboutme import AboutMe  # noqa: E402
+from profil3r.modules.porn.pornhub import Pornhub  # noqa: E402
+from profil3r.modules.programming.github import Github  # noqa: E402
+from profil3r.modules.programming.pastebin import Pastebin  # noqa: E402
+from profil3r.modules.social.flickr import Flickr  # noqa: E402
+from profil3r.modules.social.instagram import Instagram  # noqa: E402
+from profil3r.modules.social.linktree import LinkTree  # noqa: E402
+from profil3r.modules.social.myspace import MySpace  # noqa: E402
+from profil3r.modules.social.twitter import Twitter  # noqa: E402
+
+MODULES = [
+    Github,
+    Pastebin,
+    Twitter,
+    Instagram,
+    LinkTree,
+    Hackernews,
+    LessWrong,
+    JeuxVideo,
+    Flickr,
+    MySpace,
+    Pornhub,
+    AboutMe,
+]
+
+# Content of the elements whose value is not plain text
+CONTENT = {
+    ".maintable": "<tr><th>Name</th></tr>"
+    + "<tr><td>paste</td><td>1 day</td><td>Never</td><td>12</td><td>None</td></tr>"
+    * 20,
+    "div[data-testid=StyledContainer]": '<a href="https://example.com">Example</a>',
+    ".bloc-default-profil": "<li>Age : 20 ans</li><li>Genre : Homme</li>",
+    "p.followers": "1,234 Followers •56 Following",
+}
+
+
+def element(selector, content):
+    """Build an element matching a Selector."""
+    attrs = dict(selector.attrs)
+    if selector.classes:
+        attrs["class"] = " ".join(sorted(selector.classes))
+    tag = selector.tag or "div"
+    attributes = "".join(' {}="{}"'.format(k, v) for k, v in attrs.items())
+    return "<{0}{1}>{2}</{0}>".format(tag, attributes, content)
+
+
+def profile_page(fields, filler):
+    """Synthetic page holding every field of a module amid unrelated markup."""
+    snippets = {}
+    for field in fields:
+        selector = field.selector
+        count = 3 if field.index is None else field.index + 1
+        content = CONTENT.get(selector.selector, "1,234")
+        if field.child is not None:
+            content = "".join(
+                element(field.child, "1,234") for _ in range(field.child_index + 1)
+            )
+        current = snippets.get(selector.selector, (0, ""))
+        if count >= current[0]:
+            snippets[selector.selector] = (
+                count,
+                "".join(element(selector, content) for _ in range(count)),
+            )
+
+    noise = (
+        '<div class="noise"><span>text</span><p class="x">paragraph '
+        '<a href="#">link</a></p><ul><li>item</li><li>item</li></ul></div>'
+    )
+    body = noise * (filler // 2)
+    body += "".join(snippet for _, snippet in snippets.values())
+    body += noise * (filler // 2)
+    return "<html><head><title>profile</title></head><body>{}</body></html>".format(
+        body
+    )
+
+
+def previous_extract(fields, html):
+    """Previous approach: every field access scans the whole document."""
+    soup = BeautifulSoup(html, "html.parser")
+    informations = {}
+    for field in fields:
+        selector = field.selector
+
+        def match(tag):
+            return selector.match(tag.name, tag.attrs)
+
+        # The modules tested the presence of the element, then looked it up again
+        if soup.find_all(match):
+            informations[field.key] = field.extract(soup.find_all(match))
+    return informations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--filler", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'module':<12} {'previous (ms)':>14} {'compiled (ms)':>14} {'speedup':>8}")
+    for module in MODULES:
+        html = profile_page(module.fields, args.filler)
+        extractor = compile_fields(module.fields)
+
+        previous = timeit.timeit(
+            lambda: previous_extract(module.fields, html), number=args.repeat
+        )
+        compiled = timeit.timeit(lambda: extractor.extract(html), number=args.repeat)
+
+        print(
+            f"{module.__name__:<12} {previous / args.repeat * 1000:>14.2f} "
+            f"{compiled / args.repeat * 1000:>14.2f} {previous / compiled:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
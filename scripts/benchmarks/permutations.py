@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the username permutation generator.
+
+Compares the previous generate-and-filter approach (every permutation of every
+combination of names and separators, invalid ones filtered afterwards) with the
+constructive generator, for 2 to 6 name tokens. Both yield the same usernames, see
+tests/unit/python/test_permutations.py.
+Usage: python scripts/benchmarks/permutations.py [--max-tokens N] [--separators ".-_"]
+"""
+
+import argparse
+import sys
+import time
+from itertools import chain, combinations
+from itertools import permutations as itertools_permutations
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from profil3r.core._permutations import (  # noqa: E402
+    count_permutations,
+    permutations,
+)
+
+TOKENS = ["john", "doe", "jr", "smith", "paris", "1990"]
+
+
+def generate_and_filter(items, separators):
+    """Previous implementation of Core.get_permutations."""
+    items = items + separators
+    permutations_list = []
+
+    combinations_list = list(
+        chain(*map(lambda x: combinations(items, x), range(1, len(items) + 1)))
+    )
+    for combination in combinations_list:
+        for perm in list(itertools_permutations(combination)):
+            consecutives_separators = False in [
+                (perm[i] not in separators) or (perm[i + 1] not in separators)
+                for i in range(len(perm) - 1)
+            ]
+            if (
+                perm[0] not in separators
+                and perm[-1] not in separators
+                and not consecutives_separators
+            ):
+                permutations_list.append("".join(perm))
+    return permutations_list
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-tokens", type=int, default=6)
+    parser.add_argument("--separators", default=".-_")
+    args = parser.parse_args()
+    separators = list(args.separators)
+
+    print(
+        f"{'tokens':>6} {'usernames':>10} {'previous (s)':>13} "
+        f"{'generator (s)':>14} {'count (s)':>10} {'speedup':>8}"
+    )
+    for n in range(2, args.max_tokens + 1):
+        items = TOKENS[:n]
+
+        _, previous_time = timed(generate_and_filter, items, separators)
+        _, generator_time = timed(lambda: list(permutations(items, separators)))
+        count, count_time = timed(count_permutations, items, separators)
+
+        print(
+            f"{n:>6} {count:>10} {previous_time:>13.4f} {generator_time:>14.4f} "
+            f"{count_time:>10.6f} {previous_time / generator_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the k-anonymity range API of Have I Been Pwned.
+
+GET /range/<PREFIX> answers "SUFFIX:COUNT" lines, like api.pwnedpasswords.com.
+Every prefix has a fixed set of generated suffixes, plus the suffixes of the
+passwords given with --breached. Every request is counted.
+Usage: python scripts/benchmarks/range_server.py [--port N] [--latency S] [--breached X ...]
+"""
+
+import argparse
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        prefix = self.path.rstrip("/").rsplit("/", 1)[-1].upper()
+        if not self.path.startswith("/range/") or len(prefix) != 5:
+            self.send_error(404)
+            return
+
+        with self.server.lock:
+            self.server.requests.append(prefix)
+        time.sleep(self.server.latency)
+
+        body = "\r\n".join(
+            "{}:{}".format(suffix, count)
+            for suffix, count in self.server.range(prefix).items()
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RangeServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port=0, latency=0.0, breached=(), size=800):
+        super().__init__(("127.0.0.1", port), RangeHandler)
+        self.latency = latency
+        self.size = size
+        self.lock = threading.Lock()
+        self.requests = []
+        self.breached = {}
+        for password in breached:
+            digest = hashlib.sha1(password.encode("utf-8")).hexdigest().upper()
+            self.breached.setdefault(digest[:5], []).append(digest[5:])
+
+    @property
+    def range_url(self):
+        return "http://127.0.0.1:{}/range/{{}}".format(self.server_address[1])
+
+    def range(self, prefix):
+        suffixes = {}
+        for i in range(self.size):
+            seed = "{}{}".format(prefix, i).encode()
+            suffixes[hashlib.sha1(seed).hexdigest().upper()[5:]] = i % 97 + 1
+        for suffix in self.breached.get(prefix, []):
+            suffixes[suffix] = 42
+        return suffixes
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--breached", nargs="*", default=[])
+    args = parser.parse_args()
+
+    server = RangeServer(args.port, args.latency, args.breached)
+    print("Serving {}".format(server.range_url))
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,4 +2,5 @@ from profil3r.core import Core
 
 CONFIG = "config/config.json"
 
-profil3r = Core(CONFIG).run()
+if __name__ == "__main__":
+    profil3r = Core(CONFIG).run()
@@ -0,0 +1,102 @@
+"""
+Unit test configuration, the tests run offline against local stand-ins
+"""
+
+import hashlib
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# The profil3r package lives at the root of the repository
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from profil3r.engine import Resolver  # noqa: E402
+
+
+class StubLookup:
+    """Stand-in for getaddrinfo answering from a fixed zone."""
+
+    def __init__(self, zone, delay=0.0):
+        self.zone = zone
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, host):
+        with self.lock:
+            self.calls.append(host)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if host not in self.zone:
+                raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (self.zone[host], 0))]
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def stub_lookup():
+    """Zone with a few resolvable names, every lookup takes 50 ms."""
+    return StubLookup(
+        {
+            "johndoe.com": "192.0.2.1",
+            "john-doe.org": "192.0.2.2",
+            "doe.net": "192.0.2.3",
+        },
+        delay=0.05,
+    )
+
+
+@pytest.fixture
+def stub_resolver(stub_lookup):
+    """Resolver answering from the stub zone instead of the system resolver."""
+    return Resolver(workers=16, lookup=stub_lookup)
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Answers GET /range/<prefix> with the suffixes of the breached passwords."""
+
+    def do_GET(self):
+        prefix = self.path.rsplit("/", 1)[-1].upper()
+        with self.server.lock:
+            self.server.requests.append(prefix)
+
+        lines = ["0" * (40 - len(prefix)) + ":1"]
+        for password in self.server.breached:
+            digest = hashlib.sha1(password.encode("utf-8")).hexdigest().upper()
+            if digest.startswith(prefix):
+                lines.append("{}:12".format(digest[len(prefix) :]))
+        body = "\r\n".join(lines).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def range_server():
+    """Local stand-in for the k-anonymity range API, counting the requests."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.requests = []
+    server.breached = []
+    server.range_url = "http://127.0.0.1:{}/range/{{}}".format(server.server_address[1])
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
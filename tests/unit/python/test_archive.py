@@ -0,0 +1,107 @@
+"""
+Tests of the archive of the pages of the confirmed accounts and of --reextract
+"""
+
+import json
+import zlib
+from pathlib import Path
+
+import requests
+
+from profil3r.core import Core
+from profil3r.engine import ResponseArchive
+
+CONFIG = Path(__file__).resolve().parents[3] / "config" / "config.json"
+
+
+def page(body, url="https://github.com/john"):
+    r = requests.Response()
+    r._content = body.encode()
+    r.url = url
+    r.status_code = 200
+    r.encoding = "utf-8"
+    return r
+
+
+def bodies(archive):
+    return archive.connection.execute("SELECT COUNT(*) FROM bodies").fetchone()[0]
+
+
+def test_pages_are_read_back(tmp_path):
+    """A page is archived once per content, the last one of a candidate is kept."""
+    archive = ResponseArchive(str(tmp_path / "archive.sqlite"))
+    archive.put("github", "john", page("<p>generic</p>"))
+    archive.put("pastebin", "john", page("<p>generic</p>"))
+    assert bodies(archive) == 1
+
+    archive.put("github", "john", page("<p>john, updated</p>"))
+    r = archive.get("github", "john")
+    assert r.text == "<p>john, updated</p>"
+    assert r.url == "https://github.com/john"
+    assert archive.get("github", "jane") is None
+    # The generic page is still used by pastebin
+    assert bodies(archive) == 2
+    archive.close()
+
+
+def test_changed_pages_leave_no_unused_body(tmp_path):
+    """Archiving a changed page again removes its previous body."""
+    archive = ResponseArchive(str(tmp_path / "archive.sqlite"), max_bytes=2000)
+    for i in range(5):
+        archive.put("github", "john", page("john version {} ".format(i) * 50))
+    archive.put("github", "jane", page("jane " * 50))
+    archive.evict()
+
+    assert bodies(archive) == 2
+    assert archive.get("github", "john").text.startswith("john version 4")
+    assert archive.get("github", "jane") is not None
+    archive.close()
+
+
+def test_eviction(tmp_path):
+    """The oldest pages are evicted when the bodies exceed max_bytes."""
+    # Room for a single body
+    archive = ResponseArchive(
+        str(tmp_path / "archive.sqlite"), max_bytes=len(zlib.compress(b"jane", 6))
+    )
+    archive.put("github", "john", page("john"))
+    archive.put("github", "jane", page("jane"))
+    archive.evict()
+
+    assert archive.get("github", "john") is None
+    assert archive.get("github", "jane") is not None
+    assert bodies(archive) == 1
+    archive.close()
+
+
+def test_reextract(tmp_path):
+    """The extractors are run over the archived pages, without any request."""
+    with open(CONFIG) as f:
+        config = json.load(f)
+    config["profil3r"].update(
+        {
+            "cache": False,
+            "shared_rate_limits": False,
+            "archive": True,
+            "archive_path": str(tmp_path / "archive.sqlite"),
+        }
+    )
+    path = tmp_path / "config.json"
+    with open(path, "w") as f:
+        json.dump(config, f)
+
+    core = Core(str(path))
+    core.permutations_list = ["john", "jane"]
+    services = core.get_services(["github", "facebook"])
+    url = services["github"].format.format(permutation="john")
+    core.archive.put(
+        "github", url, page('<span class="vcard-fullname">John Doe</span>', url)
+    )
+
+    core.reextract(services)
+
+    assert list(core.result) == ["github"]
+    accounts = core.result["github"]["accounts"]
+    assert [account["value"] for account in accounts] == [url]
+    assert accounts[0]["full_name"]["value"] == "John Doe"
+    core.archive.close()
@@ -0,0 +1,121 @@
+"""
+Tests of the batch mode (--targets-file), offline : the search of each target is
+replaced by fixed results
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from profil3r.core import Core
+from profil3r.core._batch import read_targets
+
+CONFIG = Path(__file__).resolve().parents[3] / "config" / "config.json"
+
+
+def test_read_targets_csv(tmp_path):
+    """One target per row, comments, blank lines and empty cells are skipped."""
+    path = tmp_path / "targets.csv"
+    path.write_text("# targets\njohn,doe\n\n jane , ,smith\n,\nalice\n")
+
+    assert list(read_targets(str(path))) == [
+        ("john_doe", ["john", "doe"]),
+        ("jane_smith", ["jane", "smith"]),
+        ("alice", ["alice"]),
+    ]
+
+
+def test_read_targets_ndjson(tmp_path):
+    """Profiles given as a list or a string, with an optional id."""
+    path = tmp_path / "targets.ndjson"
+    path.write_text(
+        '{"profile": ["john", "doe"]}\n'
+        "\n"
+        '{"profile": "jane smith", "id": "case-42"}\n'
+    )
+
+    assert list(read_targets(str(path))) == [
+        ("john_doe", ["john", "doe"]),
+        ("case-42", ["jane", "smith"]),
+    ]
+
+
+class Interrupted(Exception):
+    """Stands for the run being killed."""
+
+
+def batch_core(tmp_path, searched, interrupt=None):
+    with open(CONFIG) as f:
+        config = json.load(f)
+    config["report_elements"] = ["github"]
+    config["profil3r"].update(
+        {
+            "cache": False,
+            "shared_rate_limits": False,
+            "journal": True,
+            "journal_path": str(tmp_path / "journals" / "{}.ndjson"),
+        }
+    )
+    path = tmp_path / "config.json"
+    with open(path, "w") as f:
+        json.dump(config, f)
+    core = Core(str(path))
+
+    # No request, every target has an account on github
+    def search(services, deadline=None, target=""):
+        if target == interrupt:
+            raise Interrupted()
+        searched.append(target)
+        core.result["github"] = {
+            "type": "programming",
+            "accounts": [{"value": "https://github.com/" + target}],
+            "status": "complete",
+        }
+
+    core.search = search
+    return core
+
+
+def read_index(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_batch_index_and_resume(tmp_path, monkeypatch):
+    """A line per target is written to the index, a resumed batch skips the targets
+    already done and appends to the same index."""
+    monkeypatch.chdir(tmp_path)
+    targets = tmp_path / "targets.csv"
+    targets.write_text("john,doe\njane\nalice\n")
+
+    searched = []
+    core = batch_core(tmp_path, searched, interrupt="jane")
+    core.targets_file = str(targets)
+    with pytest.raises(Interrupted):
+        core.run(profiles_list=[], interactive=False)
+    run_id = core.run_id
+
+    index_path = "./reports/batch/{}.ndjson".format(run_id)
+    (line,) = read_index(index_path)
+    assert searched == ["john_doe"]
+    assert line["target"] == "john_doe"
+    assert line["profile"] == ["john", "doe"]
+    assert line["accounts"] == 1
+    assert line["status"] == {"github": "complete"}
+    assert os.path.exists(line["reports"]["json"])
+
+    searched = []
+    resumed = batch_core(tmp_path, searched)
+    resumed.resume = run_id
+    assert resumed.run(profiles_list=[], interactive=False) == index_path
+
+    assert searched == ["jane", "alice"]
+    assert [line["target"] for line in read_index(index_path)] == [
+        "john_doe",
+        "jane",
+        "alice",
+    ]
+    # Every target is reported, the journal of the run is deleted
+    assert os.listdir(str(tmp_path / "journals")) == []
@@ -0,0 +1,44 @@
+"""
+Tests of the per-host circuit breaker of the engine
+"""
+
+import time
+
+from profil3r.engine import CircuitBreaker
+
+
+def test_breaker_opens_after_consecutive_failures():
+    """The breaker opens at the threshold, a success resets the count."""
+    breaker = CircuitBreaker(threshold=3, cooldown=60)
+
+    breaker.failure()
+    breaker.failure()
+    breaker.success()
+    breaker.failure()
+    breaker.failure()
+    assert breaker.allow()
+
+    breaker.failure()
+    assert breaker.state() == "open"
+    assert not breaker.allow()
+
+
+def test_breaker_half_open_after_cooldown():
+    """A single trial request is let through after the cool-down."""
+    breaker = CircuitBreaker(threshold=1, cooldown=0.05)
+    breaker.failure()
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    # The trial fails, the breaker opens again for another cool-down
+    breaker.failure()
+    assert breaker.state() == "open"
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.success()
+    assert breaker.state() == "closed"
+    assert breaker.allow() and breaker.allow()
@@ -0,0 +1,130 @@
+"""
+Tests of the result cache kept on disk between the runs
+"""
+
+import requests
+
+from profil3r.engine import Engine, ResultCache
+from profil3r.engine import cache as cache_module
+from profil3r.modules.service import Service
+
+
+class Clock:
+    """Stand-in for time.time, moved forward by the tests."""
+
+    def __init__(self):
+        self.now = 1000000.0
+
+    def __call__(self):
+        return self.now
+
+
+def open_cache(tmp_path, monkeypatch, **options):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    return ResultCache(str(tmp_path / "results.sqlite"), **options), clock
+
+
+def test_ttl(tmp_path, monkeypatch):
+    """Confirmed accounts are kept ttl seconds, missing ones negative_ttl seconds."""
+    cache, clock = open_cache(tmp_path, monkeypatch, ttl=100, negative_ttl=10)
+    cache.put("github", "john", {"value": "john"}, False)
+    cache.put("github", "doe", None, False)
+
+    clock.now += 5
+    assert cache.get("github", "john", False) == (True, {"value": "john"})
+    assert cache.get("github", "doe", False) == (True, None)
+    assert cache.get("github", "jane", False) == (False, None)
+
+    clock.now += 10
+    assert cache.get("github", "john", False) == (True, {"value": "john"})
+    assert cache.get("github", "doe", False) == (False, None)
+
+    clock.now += 100
+    assert cache.get("github", "john", False) == (False, None)
+    cache.close()
+
+
+def test_platform_ttl(tmp_path, monkeypatch):
+    """The ttls of a platform override the defaults of the cache."""
+    cache, clock = open_cache(tmp_path, monkeypatch, ttl=100, negative_ttl=10)
+    cache.put("github", "john", {"value": "john"}, False)
+    cache.put("github", "doe", None, False)
+
+    clock.now += 50
+    assert cache.get("github", "john", False, ttl=20) == (False, None)
+    assert cache.get("github", "doe", False, negative_ttl=60) == (True, None)
+    cache.close()
+
+
+def test_scraped(tmp_path, monkeypatch):
+    """An existence-only account is not returned to a scraping run."""
+    cache, _ = open_cache(tmp_path, monkeypatch)
+    cache.put("github", "john", {"value": "john"}, False)
+    cache.put("github", "doe", None, False)
+
+    assert cache.get("github", "john", True) == (False, None)
+    assert cache.get("github", "john", False) == (True, {"value": "john"})
+    # A missing account is missing for a scraping run too
+    assert cache.get("github", "doe", True) == (True, None)
+
+    cache.put("github", "john", {"value": "john", "name": "John"}, True)
+    assert cache.get("github", "john", False) == (
+        True,
+        {"value": "john", "name": "John"},
+    )
+    cache.close()
+
+
+def test_eviction(tmp_path, monkeypatch):
+    """The oldest entries are evicted beyond max_entries."""
+    cache, clock = open_cache(tmp_path, monkeypatch, max_entries=3)
+    for i in range(5):
+        clock.now += 1
+        cache.put("github", "john{}".format(i), None, False)
+
+    cache.evict()
+    assert [cache.get("github", "john{}".format(i), False)[0] for i in range(5)] == [
+        False,
+        False,
+        True,
+        True,
+        True,
+    ]
+    cache.close()
+
+
+class CountingService(Service):
+    """Only "john" exists, the probes are counted."""
+
+    type = "stub"
+    delay = 0
+    existence_only = True
+    probes = 0
+
+    def candidates(self):
+        return ["john", "doe"]
+
+    def local_response(self, username):
+        CountingService.probes += 1
+        r = requests.Response()
+        r.status_code = 200 if username == "john" else 404
+        return r
+
+
+def test_refresh(tmp_path):
+    """Outcomes are served from the cache unless the run refreshes them."""
+    CountingService.probes = 0
+    engine = Engine(cache=ResultCache(str(tmp_path / "results.sqlite")))
+    services = {"stub": CountingService()}
+
+    for _ in range(2):
+        results = engine.run(services)
+        assert results["stub"]["accounts"] == [{"value": "john"}]
+    assert CountingService.probes == 2
+
+    engine.refresh = True
+    results = engine.run(services)
+    assert results["stub"]["accounts"] == [{"value": "john"}]
+    assert CountingService.probes == 4
+    engine.cache.close()
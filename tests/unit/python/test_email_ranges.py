@@ -0,0 +1,129 @@
+"""
+Tests of the k-anonymity range batching of the email module
+"""
+
+import os
+import threading
+
+from profil3r.engine import Engine
+from profil3r.modules.email.email import Email
+from profil3r.modules.email.ranges import RangeCache
+
+
+def email_config(range_server, cache, ttl=86400):
+    return {
+        "plateform": {
+            "email": {
+                "rate_limit": 0,
+                "domains": ["gmail.com", "yahoo.com", "hotmail.com"],
+                "format": "{permutation}@{domain}",
+                "type": "email",
+                "range_url": range_server.range_url,
+                "range_cache_path": str(cache),
+                "range_cache_ttl": ttl,
+            }
+        }
+    }
+
+
+class OneCharacterPrefixEmail(Email):
+    """Email module with 16 possible prefixes, so that candidates share ranges."""
+
+    def hash(self, possible_email):
+        prefix, suffix = super().hash(possible_email)
+        return prefix[:1], prefix[1:] + suffix
+
+
+def search(email):
+    return Engine(max_per_host=4).run({"email": email})["email"]
+
+
+def test_breached_candidates(range_server, tmp_path):
+    """Candidates are answered from their range, breached or not."""
+    range_server.breached = ["john.doe@gmail.com"]
+    email = Email(email_config(range_server, tmp_path), ["john.doe", "jdoe"])
+
+    accounts = {a["value"]: a["breached"] for a in search(email)["accounts"]}
+
+    assert accounts["john.doe@gmail.com"] is True
+    assert accounts["jdoe@gmail.com"] is False
+    assert len(accounts) == 6
+
+
+def test_one_request_per_prefix(range_server, tmp_path):
+    """Candidates sharing a prefix are answered by a single range request."""
+    permutations = ["john", "doe", "johndoe", "doejohn", "john.doe", "doe.john"]
+    email = OneCharacterPrefixEmail(email_config(range_server, tmp_path), permutations)
+    prefixes = {email.hash(candidate)[0] for candidate in email.candidates()}
+
+    result = search(email)
+
+    assert len(result["accounts"]) == 18
+    assert len(prefixes) < 18
+    assert sorted(range_server.requests) == sorted(prefixes)
+
+
+def test_ranges_are_cached_on_disk(range_server, tmp_path):
+    """A second run answers from the disk cache, without any request."""
+    config = email_config(range_server, tmp_path)
+    range_server.breached = ["doe@yahoo.com"]
+
+    first = search(Email(config, ["john", "doe"]))
+    requests = len(range_server.requests)
+    second = search(Email(config, ["john", "doe"]))
+
+    assert requests == 6
+    assert len(range_server.requests) == requests
+    assert first["accounts"] == second["accounts"]
+    assert len(os.listdir(tmp_path)) == 6
+
+
+def test_worker_reads_cached_ranges(range_server, tmp_path):
+    """A worker, whose candidates come from the work queue, reads the disk cache."""
+    config = email_config(range_server, tmp_path)
+    range_server.breached = ["doe@yahoo.com"]
+    search(Email(config, ["doe"]))
+    requests = len(range_server.requests)
+
+    email = Email(config, [])
+    email.setup()
+    states = Engine(max_per_host=4).probe_items(
+        {"email": email}, [("email", "doe@yahoo.com"), ("email", "doe@gmail.com")]
+    )
+
+    assert [account["breached"] for state, account in states] == [True, False]
+    assert len(range_server.requests) == requests
+
+
+def test_expired_ranges_are_fetched_again(range_server, tmp_path):
+    """Ranges older than the TTL are fetched again."""
+    config = email_config(range_server, tmp_path, ttl=0)
+
+    search(Email(config, ["john"]))
+    search(Email(config, ["john"]))
+
+    assert len(range_server.requests) == 6
+
+
+def test_concurrent_range_writers(tmp_path):
+    """Runs saving the same range at the same time never fail."""
+    cache = tmp_path / "ranges"
+    caches = [RangeCache(str(cache)) for _ in range(8)]
+    errors = []
+
+    def write(range_cache):
+        try:
+            for _ in range(50):
+                range_cache.put("ABCDE", "SUFFIX:1")
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=write, args=(c,)) for c in caches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert os.listdir(str(cache)) == ["ABCDE"]
+    assert caches[0].get("ABCDE") == "SUFFIX:1"
@@ -0,0 +1,274 @@
+"""
+Tests of the two-stage engine, offline with local responses
+"""
+
+import http.server
+import threading
+import time
+
+import pytest
+import requests
+
+from profil3r.engine import Engine, MirrorPool, Session
+from profil3r.modules.service import Service
+
+
+class SlowScrapeService(Service):
+    """Every candidate exists, scraping a page takes a second."""
+
+    type = "stub"
+    delay = 0
+
+    def candidates(self):
+        return ["john{}".format(i) for i in range(4)]
+
+    def local_response(self, username):
+        r = requests.Response()
+        r.status_code = 200
+        return r
+
+    def scrape(self, username, r):
+        time.sleep(1)
+        return {"value": username, "scraped": True}
+
+
+def test_deadline_keeps_confirmed_accounts():
+    """Accounts waiting for the second stage at the deadline are not lost."""
+    engine = Engine(enrich_concurrency=1, parse_backend="thread")
+    service = SlowScrapeService()
+
+    streamed = [
+        account["value"]
+        for _, account in engine.stream({"stub": service}, deadline=0.5)
+    ]
+    results = engine.run({"stub": service}, deadline=0.5)
+
+    accounts = results["stub"]["accounts"]
+    assert results["stub"]["status"] == "truncated"
+    assert [account["value"] for account in accounts] == service.candidates()
+    assert not any(account.get("scraped") for account in accounts)
+    assert sorted(streamed) == service.candidates()
+
+
+class SharedUrlService(Service):
+    """Two candidates probe the same URL, the responses are counted."""
+
+    type = "stub"
+    delay = 0
+    existence_only = True
+    sent = []
+
+    def candidates(self):
+        return ["john", "John"]
+
+    def probe_url(self, username):
+        return username.lower()
+
+    def fetch(self, username):
+        SharedUrlService.sent.append(username)
+        time.sleep(0.2)
+        r = requests.Response()
+        r.status_code = 200
+        return r
+
+
+def test_requests_in_flight_are_shared():
+    """Concurrent probes of a URL share one request, the response is not kept."""
+    SharedUrlService.sent = []
+    engine = Engine(max_per_host=2)
+
+    results = engine.run({"stub": SharedUrlService()})
+
+    assert len(results["stub"]["accounts"]) == 2
+    assert len(SharedUrlService.sent) == 1
+    assert engine.fetches == {}
+
+
+class MirrorHandler(http.server.BaseHTTPRequestHandler):
+    """Mirror front-end where "john" exists, answering after server.latency."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        self.send_response(200 if "john" in self.path else 404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+@pytest.fixture
+def mirror_servers():
+    servers = []
+    for latency in (0.5, 0):
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), MirrorHandler)
+        server.latency = latency
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+    yield ["http://127.0.0.1:{}/{{}}".format(s.server_address[1]) for s in servers]
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+class MirroredService(Service):
+    """Accounts looked up on the mirrors, the fastest one by health check first."""
+
+    type = "stub"
+    existence_only = True
+
+    def __init__(self, mirrors, latencies, delay=0):
+        self.mirror_list = mirrors
+        self.latencies = latencies
+        self.delay = delay
+        self.session = Session()
+
+    def candidates(self):
+        return ["john", "doe", "jane", "johnny"]
+
+    def setup(self):
+        self.mirrors = MirrorPool("stub", self.mirror_list, "john", self.session)
+        self.mirrors.latencies = dict(zip(self.mirror_list, self.latencies))
+
+    def probe_url(self, username):
+        return self.mirror_url(self.mirrors.best(), username)
+
+
+def test_mirror_latency_excludes_waits(mirror_servers):
+    """Only the requests are timed, not the waits for a token of the host."""
+    fast = mirror_servers[1]
+    service = MirroredService([fast, mirror_servers[0]], [0.01, 0.02], delay=0.2)
+    engine = Engine(hedge_ratio=0.1)
+
+    results = engine.run({"stub": service})
+
+    assert len(results["stub"]["accounts"]) == 2
+    assert len(service.mirrors.recent[fast]) == 4
+    assert max(service.mirrors.recent[fast]) < 0.1
+
+
+def test_slow_mirror_is_hedged(mirror_servers):
+    """Requests slower than usual on the primary mirror are sent to the backup."""
+    slow, fast = mirror_servers
+    service = MirroredService([slow, fast], [0.01, 0.02])
+    engine = Engine(hedge_ratio=1)
+
+    started = time.monotonic()
+    results = engine.run({"stub": service})
+
+    assert len(results["stub"]["accounts"]) == 2
+    assert engine.hedges == 4
+    assert time.monotonic() - started < 1
+
+
+class ScrapeService(SlowScrapeService):
+    """Every candidate exists, the pages are scraped at once."""
+
+    def scrape(self, username, r):
+        return {"value": username, "scraped": True}
+
+
+class BrokenScrapeService(SlowScrapeService):
+    """Every candidate exists, the extractors fail on every page."""
+
+    def scrape(self, username, r):
+        raise TypeError("unexpected page")
+
+
+def test_scrape_errors_keep_the_account():
+    """A failing extractor keeps the probed account and the other services."""
+    engine = Engine(parse_backend="inline")
+    service = ScrapeService()
+
+    results = engine.run({"broken": BrokenScrapeService(), "healthy": service})
+
+    assert results["broken"]["accounts"] == [
+        {"value": username} for username in service.candidates()
+    ]
+    assert [account["value"] for account in results["healthy"]["accounts"]] == (
+        service.candidates()
+    )
+    assert all(account["scraped"] for account in results["healthy"]["accounts"])
+
+
+class ManyCandidatesService(Service):
+    """A million candidates, generated lazily, none of them exists."""
+
+    type = "stub"
+    delay = 0
+    existence_only = True
+    generated = 0
+
+    def candidates(self):
+        for i in range(1000000):
+            ManyCandidatesService.generated += 1
+            yield "john{}".format(i)
+
+    def fetch(self, username):
+        time.sleep(0.01)
+        r = requests.Response()
+        r.status_code = 404
+        return r
+
+
+def test_candidates_are_pulled_by_bounded_probes():
+    """Only the candidates probed before the deadline are generated."""
+    ManyCandidatesService.generated = 0
+    engine = Engine(breaker_threshold=0)
+
+    started = time.monotonic()
+    results = engine.run({"stub": ManyCandidatesService()}, deadline=0.5)
+
+    assert results["stub"]["status"] == "truncated"
+    assert time.monotonic() - started < 1
+    assert ManyCandidatesService.generated < 1000
+
+
+class ThrottledService(Service):
+    """Every request is throttled by the site."""
+
+    type = "stub"
+    delay = 0
+    existence_only = True
+
+    def candidates(self):
+        return ["john", "doe"]
+
+    def fetch(self, username):
+        r = requests.Response()
+        r.status_code = 429
+        return r
+
+
+def test_throttled_candidates_are_not_misses():
+    """Candidates still throttled after the retries leave the search incomplete."""
+    engine = Engine(throttle_retries=1, retry_backoff=0, breaker_threshold=0)
+
+    results = engine.run({"stub": ThrottledService()})
+
+    assert results["stub"] == {"type": "stub", "accounts": [], "status": "truncated"}
+
+
+class UnreachableService(Service):
+    """Nothing listens on the port of the site."""
+
+    type = "stub"
+    delay = 0
+    existence_only = True
+    report_errors = False
+
+    def candidates(self):
+        return ["http://127.0.0.1:9/john", "http://127.0.0.1:9/doe"]
+
+    def fetch(self, username):
+        return requests.get(username, timeout=5)
+
+
+def test_unreachable_candidates():
+    """Unreachable candidates leave the search incomplete, unless they are missing."""
+    engine = Engine(breaker_threshold=0)
+    service = UnreachableService()
+    assert engine.run({"stub": service})["stub"]["status"] == "truncated"
+
+    service.unreachable_missing = True
+    assert engine.run({"stub": service})["stub"]["status"] == "complete"
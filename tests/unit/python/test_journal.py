@@ -0,0 +1,99 @@
+"""
+Tests of the journal of the completed probes, used to resume an interrupted run
+"""
+
+import json
+import os
+from pathlib import Path
+
+from profil3r.core import Core
+from profil3r.engine import Journal
+
+CONFIG = Path(__file__).resolve().parents[3] / "config" / "config.json"
+
+
+def test_resume_from_journal(tmp_path):
+    """The outcomes of the targets not completed are read back, cut lines skipped."""
+    path = str(tmp_path / "run.ndjson")
+
+    journal = Journal(path)
+    journal.write({"run": "1", "profile": ["john", "doe"]})
+    journal.target = "john_doe"
+    journal.record("github", "https://github.com/john", {"value": "john"})
+    journal.done("john_doe")
+    journal.target = "jane"
+    journal.record("github", "https://github.com/jane", None)
+    journal.close()
+    # The run was killed while writing a line
+    with open(path, "a") as f:
+        f.write('{"target": "jane", "serv')
+
+    resumed = Journal(path)
+    assert resumed.load() == {"run": "1", "profile": ["john", "doe"]}
+    assert resumed.completed == {"john_doe"}
+
+    resumed.target = "jane"
+    assert resumed.get("github", "https://github.com/jane") == (True, None)
+    assert resumed.get("github", "https://github.com/janedoe") == (False, None)
+
+    # The next line does not extend the cut one
+    resumed.record("github", "https://github.com/janedoe", None)
+    resumed.close()
+    again = Journal(path)
+    again.load()
+    again.target = "jane"
+    assert again.get("github", "https://github.com/janedoe") == (True, None)
+
+
+def core_with_journal(tmp_path, journal=None):
+    with open(CONFIG) as f:
+        config = json.load(f)
+    config["profil3r"].update(
+        {
+            "cache": False,
+            "shared_rate_limits": False,
+            "journal_path": str(tmp_path / "journals" / "{}.ndjson"),
+        }
+    )
+    if journal is not None:
+        config["profil3r"]["journal"] = journal
+    path = tmp_path / "config.json"
+    with open(path, "w") as f:
+        json.dump(config, f)
+    return Core(str(path))
+
+
+def test_resume_restores_options(tmp_path):
+    """The options of the run are restored with the profile, the journal is deleted
+    once the reports are written."""
+    core = core_with_journal(tmp_path)
+    core.items = ["john", "doe"]
+    core.existence_only = True
+    core.workers = 3
+    core.start_journal(interactive=True, deadline=60)
+    run_id = core.run_id
+    core.close_journal()
+
+    resumed = core_with_journal(tmp_path)
+    resumed.resume_journal(run_id)
+    assert resumed.items == ["john", "doe"]
+    assert resumed.existence_only is True
+    assert resumed.workers == 3
+    assert resumed.deadline == 60
+
+    resumed.close_journal(remove=True)
+    assert os.listdir(str(tmp_path / "journals")) == []
+
+
+def test_non_interactive_runs_without_journal(tmp_path):
+    """Runs of the web UI only keep a journal when the setting is set."""
+    core = core_with_journal(tmp_path)
+    core.items = ["john", "doe"]
+    core.start_journal(interactive=False)
+    assert core.journal is None
+
+    core = core_with_journal(tmp_path, journal=True)
+    core.items = ["john", "doe"]
+    core.start_journal(interactive=False)
+    assert core.journal is not None
+    core.close_journal()
@@ -0,0 +1,49 @@
+"""
+Tests of the adaptive per-host concurrency limit of the engine
+"""
+
+import requests
+
+from profil3r.engine import AdaptiveLimit
+from profil3r.engine.limiter import retry_after
+
+
+def response(headers):
+    r = requests.Response()
+    r.status_code = 429
+    r.headers.update(headers)
+    return r
+
+
+def test_retry_after():
+    """Retry-After is a number of seconds or an HTTP date."""
+    assert retry_after(response({"Retry-After": "2"})) == 2
+    assert retry_after(response({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0
+    assert retry_after(response({"Retry-After": "soon"})) is None
+    assert retry_after(response({})) is None
+
+
+def test_limit_grows_additively_and_halves():
+    """The limit grows by one per window of fast answers and is halved on 429."""
+    limit = AdaptiveLimit(1, 8)
+
+    for _ in range(1 + 2 + 3):
+        limit.success(0.1)
+    assert int(limit.limit) == 4
+
+    # Slow answers do not grow the limit
+    limit.success(1)
+    assert int(limit.limit) == 4
+
+    limit.decrease()
+    assert limit.limit == 2
+    for _ in range(10):
+        limit.decrease()
+    assert limit.limit == 1
+
+
+def test_limit_is_capped():
+    limit = AdaptiveLimit(2, 3)
+    for _ in range(100):
+        limit.success(0.1)
+    assert limit.limit == 3
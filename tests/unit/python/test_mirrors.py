@@ -0,0 +1,67 @@
+"""
+Tests of the health of the mirror front-ends kept between the runs
+"""
+
+import os
+import threading
+
+import requests
+
+from profil3r.engine import Engine, MirrorPool, MirrorState
+from profil3r.modules.social.twitter import Twitter
+
+
+def test_concurrent_writers(tmp_path):
+    """Runs saving the state at the same time never fail nor leave a partial file."""
+    path = str(tmp_path / "mirrors.json")
+    errors = []
+
+    def write(index):
+        # One MirrorState per run, as in separate processes
+        state = MirrorState(path)
+        try:
+            for i in range(50):
+                state.put("pool{}".format(index), ["m"], {"m": i})
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert MirrorState(path).load() != {}
+    assert os.listdir(str(tmp_path)) == ["mirrors.json"]
+
+
+def test_all_down_not_kept(tmp_path):
+    """Mirrors found all down are checked again by the next run."""
+    state = MirrorState(str(tmp_path / "mirrors.json"))
+    mirrors = ["http://127.0.0.1:9/{}"]
+
+    pool = MirrorPool("pool", mirrors, "jack", session=requests.Session(), state=state)
+    assert pool.rank() == []
+    assert state.get("pool", mirrors) is None
+
+
+def test_all_down_service_unavailable():
+    """A site whose mirrors are all down is reported unavailable, not complete."""
+    config = {
+        "plateform": {
+            "tiktok": {"rate_limit": 0},
+            "twitter": {
+                "format": "https://twitter.com/{permutation}",
+                "type": "social",
+                "mirrors": ["http://127.0.0.1:9/{}"],
+            },
+        }
+    }
+    twitter = Twitter(config, ["johndoe"])
+    twitter.session = requests.Session()
+
+    result = Engine().run({"twitter": twitter})["twitter"]
+
+    assert result["status"] == "unavailable"
+    assert result["accounts"] == []
@@ -0,0 +1,130 @@
+"""
+Tests of the username permutation generator against the previous generate-and-filter
+implementation
+"""
+
+from itertools import chain, combinations
+from itertools import permutations as itertools_permutations
+
+import pytest
+
+from profil3r.core._permutations import (
+    RankedPermutations,
+    count_permutations,
+    permutations,
+    ranked_permutations,
+)
+from profil3r.modules.social.facebook import Facebook
+
+CONFIG = {
+    "plateform": {
+        "facebook": {
+            "rate_limit": 0,
+            "format": "https://facebook.com/{permutation}",
+            "type": "social",
+        }
+    }
+}
+
+
+def generate_and_filter(items, separators):
+    """Previous implementation of Core.get_permutations."""
+    items = items + separators
+    permutations_list = []
+
+    combinations_list = list(
+        chain(*map(lambda x: combinations(items, x), range(1, len(items) + 1)))
+    )
+    for combination in combinations_list:
+        for perm in list(itertools_permutations(combination)):
+            consecutives_separators = False in [
+                (perm[i] not in separators) or (perm[i + 1] not in separators)
+                for i in range(len(perm) - 1)
+            ]
+            if (
+                perm[0] not in separators
+                and perm[-1] not in separators
+                and not consecutives_separators
+            ):
+                permutations_list.append("".join(perm))
+    return permutations_list
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        ["john"],
+        ["john", "doe"],
+        ["john", "doe", "jr"],
+        ["john", "doe", "jr", "smith"],
+        ["john", "doe", "jr", "smith", "paris"],
+        ["john", "john", "doe"],
+    ],
+)
+def test_same_usernames_as_generate_and_filter(items):
+    separators = [".", "-", "_"]
+    generated = list(permutations(items, separators))
+
+    assert len(generated) == len(set(generated))
+    assert set(generated) == set(generate_and_filter(items, separators))
+    assert len(generated) == count_permutations(items, separators)
+
+
+@pytest.mark.parametrize("items", [["ab", "a", "b"], ["aa", "a", "b", "ab"]])
+def test_usernames_built_in_two_ways(items):
+    """A username built from different names is counted and yielded once per way."""
+    separators = [".", "-", "_"]
+    generated = list(permutations(items, separators))
+    distinct = set(generate_and_filter(items, separators))
+
+    assert len(generated) == count_permutations(items, separators)
+    assert len(set(generated)) == len(distinct) < len(generated)
+    assert set(ranked_permutations(items, separators)) == distinct
+
+    facebook = Facebook(CONFIG, RankedPermutations(items, separators))
+    canonical = list(facebook.canonical_permutations())
+    assert len(canonical) == len(distinct)
+    assert set(canonical) == distinct
+
+
+def test_ranked_permutations():
+    """Same usernames, fewest separators between the names first, then shortest."""
+    items = ["jean-luc", "picard", "jr"]
+    separators = [".", "-", "_"]
+    ranked = list(ranked_permutations(items, separators))
+
+    assert sorted(ranked) == sorted(permutations(items, separators))
+    # Separators between the names, the one inside "jean-luc" does not count
+    scores = [
+        (
+            sum(c in separators for c in username.replace("jean-luc", "")),
+            len(username),
+        )
+        for username in ranked
+    ]
+    assert scores == sorted(scores)
+    assert ranked[:3] == ["jr", "picard", "jean-luc"]
+    assert ranked.index("jean-lucpicard") < ranked.index("jr.picard")
+
+
+def test_case_insensitive_module():
+    """Candidates lowercased by the module unless the config makes them case sensitive."""
+    facebook = Facebook(CONFIG, ["JohnDoe", "johndoe", "John.Doe"])
+
+    assert list(facebook.canonical_permutations()) == ["johndoe", "john.doe"]
+
+    facebook.case_sensitive = True
+    assert list(facebook.canonical_permutations()) == ["JohnDoe", "johndoe", "John.Doe"]
+
+
+def test_ranked_permutations_are_reiterable():
+    """The permutations of a profile are generated again on each iteration."""
+    items = ["john", "doe", "jr"]
+    separators = [".", "-", "_"]
+    permutations_list = RankedPermutations(items, separators)
+
+    assert list(permutations_list) == list(ranked_permutations(items, separators))
+    assert list(permutations_list) == list(ranked_permutations(items, separators))
+    assert next(iter(permutations_list)) == "jr"
+    assert permutations_list
+    assert not RankedPermutations([], separators)
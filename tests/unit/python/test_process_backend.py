@@ -0,0 +1,103 @@
+"""
+Tests of the process parse backend with the services built by the Core
+"""
+
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+
+from profil3r.core import Core
+
+CONFIG = Path(__file__).resolve().parents[3] / "config" / "config.json"
+
+PROFILE = """
+<div class="profile-card-fullname">John Doe</div>
+<div class="profile-bio">Hello</div>
+"""
+
+
+class ProfileHandler(BaseHTTPRequestHandler):
+    """Every account exists, the page is a nitter profile."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        body = PROFILE.encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def profile_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ProfileHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield "http://127.0.0.1:{}".format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def core(tmp_path, profile_server):
+    with open(CONFIG) as f:
+        config = json.load(f)
+    config["profil3r"].update(
+        {
+            "cache": False,
+            "shared_rate_limits": False,
+            "mirrors_path": str(tmp_path / "mirrors.json"),
+            "parse_backend": "process",
+        }
+    )
+    config["plateform"]["twitter"]["mirrors"] = [profile_server + "/{}"]
+    path = tmp_path / "config.json"
+    with open(path, "w") as f:
+        json.dump(config, f)
+
+    core = Core(str(path))
+    core.permutations_list = ["johndoe"]
+    return core
+
+
+def test_services_are_sent_to_parser_processes(core, profile_server):
+    """The services of get_services(), once set up, scrape in a worker process."""
+    services = core.get_services(["twitter", "github", "domain"])
+    services["twitter"].setup()
+    assert services["twitter"].mirrors is not None
+    assert services["domain"].resolver is core.resolver
+    assert not hasattr(services["github"], "resolver")
+
+    r = requests.get(profile_server + "/johndoe")
+    with ProcessPoolExecutor(max_workers=1) as parsers:
+        accounts = {
+            name: parsers.submit(service.scrape, "johndoe", r).result()
+            for name, service in services.items()
+        }
+
+    assert all(account["value"] == "johndoe" for account in accounts.values())
+    assert accounts["twitter"]["full_name"]["value"] == "John Doe"
+
+
+def test_parser_pool_is_kept_between_runs(core):
+    """The parser processes are started once for every run of the engine."""
+    results = []
+    pools = []
+    for _ in range(2):
+        services = core.get_services(["twitter"])
+        results.append(core.engine.run(services)["twitter"])
+        pools.append(core.engine.parsers)
+
+    assert isinstance(pools[0], ProcessPoolExecutor)
+    assert pools[0] is pools[1]
+    for result in results:
+        assert result["accounts"][0]["full_name"]["value"] == "John Doe"
+
+    core.engine.close()
+    assert core.engine.parsers is None
@@ -0,0 +1,82 @@
+"""
+Tests of the bulk DNS pre-resolution of the domain module
+"""
+
+import time
+
+from profil3r.modules.domain.domain import Domain
+
+CONFIG = {
+    "plateform": {
+        "domain": {
+            "rate_limit": 100,
+            "format": "http://{permutation}.{domain}",
+            "TLD": ["com", "org", "net"],
+            "type": "domain",
+            "enabled": "yes",
+        }
+    }
+}
+
+
+def test_resolve_all_keeps_resolvable_hosts(stub_resolver):
+    """Only the names of the zone are resolvable."""
+    hosts = ["johndoe.com", "johndoe.org", "doe.net", "nothing.com"]
+    assert stub_resolver.resolve_all(hosts) == {"johndoe.com", "doe.net"}
+
+
+def test_resolve_all_is_concurrent(stub_resolver, stub_lookup):
+    """32 lookups of 50 ms each take far less than their sequential time."""
+    hosts = ["host{}.com".format(i) for i in range(32)]
+
+    start = time.monotonic()
+    stub_resolver.resolve_all(hosts)
+
+    assert time.monotonic() - start < 32 * 0.05 / 2
+    assert stub_lookup.max_active > 1
+
+
+def test_resolver_cache(stub_resolver, stub_lookup):
+    """A host is looked up once, whether it resolves or not."""
+    stub_resolver.resolve_all(["johndoe.com", "nothing.com"])
+    stub_resolver.resolve_all(["johndoe.com", "nothing.com", "johndoe.com"])
+
+    assert sorted(stub_lookup.calls) == ["johndoe.com", "nothing.com"]
+
+
+def test_resolver_cache_expires(stub_resolver, stub_lookup):
+    """Expired entries are looked up again."""
+    stub_resolver.ttl = stub_resolver.negative_ttl = 0
+    stub_resolver.resolve_all(["johndoe.com", "nothing.com"])
+    stub_resolver.resolve_all(["johndoe.com", "nothing.com"])
+
+    assert len(stub_lookup.calls) == 4
+
+
+def test_domain_only_probes_resolvable_candidates(stub_resolver):
+    """The domain module sends no HTTP request to names that do not resolve."""
+    domain = Domain(CONFIG, ["johndoe", "john-doe", "doe", "JohnDoe"])
+    domain.resolver = stub_resolver
+    domain.setup()
+
+    assert list(domain.candidates()) == [
+        "http://johndoe.com",
+        "http://john-doe.org",
+        "http://doe.net",
+    ]
+
+
+def test_domain_resolves_only_probed_candidates(stub_resolver, stub_lookup):
+    """Only the max_candidates first names are resolved."""
+    domain = Domain(CONFIG, ["johndoe", "john-doe", "doe"])
+    domain.resolver = stub_resolver
+    domain.max_candidates = 4
+    domain.setup()
+
+    assert sorted(stub_lookup.calls) == [
+        "john-doe.com",
+        "johndoe.com",
+        "johndoe.net",
+        "johndoe.org",
+    ]
+    assert list(domain.candidates()) == ["http://johndoe.com"]
@@ -0,0 +1,66 @@
+"""
+Tests of the rate limits shared between Profil3r processes
+"""
+
+import asyncio
+import sqlite3
+
+from profil3r.engine import SharedScheduler
+
+
+def test_shared_bucket(tmp_path):
+    """Two schedulers on the same database share the tokens of a host."""
+    path = str(tmp_path / "rate_limits.sqlite")
+    first = SharedScheduler(path)
+    second = SharedScheduler(path)
+
+    assert first.reserve("example.com", 1) == 0
+    # The token of the host was taken by the other scheduler
+    assert 0.9 < second.reserve("example.com", 1) <= 1
+    assert 1.9 < first.reserve("example.com", 1) <= 2
+
+    # Other hosts have their own bucket
+    assert second.reserve("example.org", 1) == 0
+
+    first.close()
+    second.close()
+
+
+def test_stale_buckets_are_pruned(tmp_path):
+    """The buckets of the hosts not requested for max_age seconds are removed."""
+    path = str(tmp_path / "rate_limits.sqlite")
+    scheduler = SharedScheduler(path, max_age=60)
+    scheduler.reserve("example.com", 1)
+    scheduler.reserve("example.org", 1)
+    scheduler.connection.execute(
+        "UPDATE buckets SET updated = updated - 120 WHERE host = ?", ("example.com",)
+    )
+
+    scheduler.prune()
+    hosts = [row[0] for row in scheduler.connection.execute("SELECT host FROM buckets")]
+    assert hosts == ["example.org"]
+    # A pruned bucket is full
+    assert scheduler.reserve("example.com", 1) == 0
+    scheduler.close()
+
+
+def test_acquire_does_not_block_the_loop(tmp_path):
+    """A scheduler waiting for the database lock does not stop the other tasks."""
+    path = str(tmp_path / "rate_limits.sqlite")
+    scheduler = SharedScheduler(path)
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+
+    async def run():
+        ticks = 0
+        acquire = asyncio.ensure_future(scheduler.acquire("example.com", 1))
+        while not acquire.done():
+            ticks += 1
+            if ticks == 5:
+                other.execute("COMMIT")
+            await asyncio.sleep(0.05)
+        return ticks
+
+    assert asyncio.run(run()) >= 5
+    other.close()
+    scheduler.close()
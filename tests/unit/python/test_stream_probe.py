@@ -0,0 +1,66 @@
+"""
+Tests of the "stream" probe, the connection of a short response is reused
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from profil3r.engine import Session
+from profil3r.modules.service import Service
+
+
+class BodyHandler(BaseHTTPRequestHandler):
+    """Keep-alive server recording the client port of every request."""
+
+    protocol_version = "HTTP/1.1"
+    ports = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        BodyHandler.ports.append(self.client_address[1])
+        body = b"x" * (100 if "short" in self.path else 100000)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except OSError:
+            pass
+
+
+@pytest.fixture
+def body_server():
+    BodyHandler.ports = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BodyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield "http://127.0.0.1:{}".format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+def stream_service():
+    service = Service()
+    service.session = Session()
+    service.probe = "stream"
+    return service
+
+
+def test_short_body_reuses_connection(body_server):
+    service = stream_service()
+    for _ in range(5):
+        r = service.fetch_url(body_server + "/short")
+    assert r.status_code == 200
+    assert r.content == b"x" * 100
+    assert len(set(BodyHandler.ports)) == 1
+
+
+def test_long_body_is_not_downloaded(body_server):
+    service = stream_service()
+    for _ in range(3):
+        r = service.fetch_url(body_server + "/long")
+    assert r.status_code == 200
+    assert len(set(BodyHandler.ports)) == 3
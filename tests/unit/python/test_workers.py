@@ -0,0 +1,102 @@
+"""
+Tests of the work queue sharded between local worker processes
+"""
+
+import http.server
+import os
+import threading
+
+import pytest
+import requests
+
+from profil3r.engine import Engine, WorkerPool
+from profil3r.engine.workqueue import DONE, FAILED, UNAVAILABLE
+from profil3r.modules.service import Service
+
+
+class PidHandler(http.server.BaseHTTPRequestHandler):
+    """Accounts containing "john" exist, the pid of each worker is recorded."""
+
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        PidHandler.requests.append((self.headers["Host"], self.headers["X-Worker"]))
+        self.send_response(200 if "john" in self.path else 404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class StubService(Service):
+    type = "stub"
+    delay = 0
+    existence_only = True
+
+    def fetch_url(self, url):
+        return requests.get(url, headers={"X-Worker": str(os.getpid())}, timeout=5)
+
+
+def build():
+    return Engine(max_per_host=2), {"stub": StubService()}
+
+
+@pytest.fixture
+def pid_server():
+    PidHandler.requests = []
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), PidHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_worker_pool(tmp_path, pid_server):
+    """Every item is probed, each host by a single worker process."""
+    port = pid_server.server_address[1]
+    hosts = ["127.0.0.1:{}".format(port), "localhost:{}".format(port)]
+    items = [
+        ("stub", "http://{}/{}{}".format(host, name, i), host)
+        for host in hosts
+        for name in ("john", "doe")
+        for i in range(10)
+    ]
+
+    pool = WorkerPool(str(tmp_path / "queue.sqlite"), 2, build, batch=5)
+    pool.start()
+    try:
+        results = pool.run("target", items, deadline=60)
+    finally:
+        pool.stop()
+
+    assert [(service, candidate) for service, candidate, _, _ in results] == [
+        (service, candidate) for service, candidate, _ in items
+    ]
+    assert all(state == DONE for _, _, state, _ in results)
+    found = [account["value"] for _, _, _, account in results if account is not None]
+    assert found == [candidate for _, candidate, _ in items if "john" in candidate]
+
+    for host in hosts:
+        assert len({pid for h, pid in PidHandler.requests if h == host}) == 1
+    assert not os.path.exists(str(tmp_path / "queue.sqlite"))
+
+
+def test_failed_probes(tmp_path):
+    """Probes that fail are not misses, the host is then reported unavailable."""
+    # Nothing listens on the port
+    items = [
+        ("stub", "http://127.0.0.1:9/john{}".format(i), "127.0.0.1:9")
+        for i in range(10)
+    ]
+
+    pool = WorkerPool(str(tmp_path / "queue.sqlite"), 1, build, batch=10)
+    pool.start()
+    try:
+        results = pool.run("target", items, deadline=60)
+    finally:
+        pool.stop()
+
+    states = [state for _, _, state, _ in results]
+    assert set(states) == {FAILED, UNAVAILABLE}
+    assert all(account is None for _, _, _, account in results)